@@ -1,8 +1,11 @@
 import os
+from typing import Optional
 
 import click
 
+from quadipy.profile import ProfileReport, profile_config
 from quadipy.schemas.graph_format_config import GraphFormatConfig
+from quadipy.sources import read_records
 
 OK_GREEN = "\033[92m"
 OK_MARK = "\u2713"
@@ -25,6 +28,42 @@ def validate_configs(config_dir: str) -> None:
             validate_single_config(single_config_path)
 
 
+def format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < 1024 or unit == "TB":
+            break
+        size /= 1024
+    return f"{size:.1f} {unit}"
+
+
+def echo_profile_report(report: ProfileReport) -> None:
+    click.echo(f"records sampled     {report.records}")
+    click.echo(f"quads               {report.quads}")
+    click.echo(f"quads per record    {report.quads_per_record:.2f}")
+    click.echo(f"bytes per quad      {report.bytes_per_quad:.1f}")
+    click.echo(f"distinct subjects   {report.distinct_subjects}")
+    click.echo(f"distinct graphs     {report.distinct_graphs}")
+    click.echo(f"records per second  {report.records_per_second:.0f}")
+    click.echo(f"read time           {report.read_seconds:.2f}s")
+    click.echo(f"quadify time        {report.quadify_seconds:.2f}s")
+    click.echo("")
+    click.echo(f"{'predicate':<40} {'quads/record':>12} {'fill rate':>10}  columns")
+    for predicate_uri, predicate in report.predicates.items():
+        quads_per_record = predicate.quads / report.records if report.records else 0.0
+        fill_rate = predicate.records / report.records if report.records else 0.0
+        click.echo(
+            f"{predicate_uri:<40} {quads_per_record:>12.2f} {fill_rate:>10.1%}  {', '.join(predicate.columns)}"
+        )
+    click.echo("")
+    if report.total_records is None:
+        click.echo("pass --total-records to project the output of a full run")
+        return
+    click.echo(f"projected for {report.total_records} records:")
+    click.echo(f"  quads    {report.estimated_quads}")
+    click.echo(f"  size     {format_bytes(report.estimated_bytes or 0)}")
+    click.echo(f"  runtime  {report.estimated_seconds or 0:.1f}s")
+
+
 @click.group()
 def cli() -> None:
     pass
@@ -45,5 +84,29 @@ def validate(path: str) -> None:
         validate_single_config(path)
 
 
+@cli.command()
+@click.argument("config_path", type=click.Path(exists=True, dir_okay=False))
+@click.argument("records_path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--sample", default=10000, show_default=True, help="number of records sampled"
+)
+@click.option(
+    "--total-records",
+    type=int,
+    help="number of records in the full input, used to project a full run",
+)
+def profile(
+    config_path: str, records_path: str, sample: int, total_records: Optional[int]
+) -> None:
+    """
+    estimate the output of a config over a records file
+
+    records_path is a csv or jsonl file, optionally compressed e.g. records.jsonl.gz
+    """
+    config = GraphFormatConfig.parse_file(config_path)
+    report = profile_config(config, read_records(records_path), sample, total_records)
+    echo_profile_report(report)
+
+
 if __name__ == "__main__":
     cli()
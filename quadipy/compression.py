@@ -0,0 +1,331 @@
+import bz2
+import io
+import lzma
+import os
+import queue
+import threading
+import zlib
+from enum import Enum
+from typing import IO, Any, BinaryIO, Iterator, Optional, Union
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+DEFAULT_BUFFER_CHUNKS = 16
+
+_EOF = object()
+
+
+class Compression(Enum):
+    gzip = "gzip"
+    bz2 = "bz2"
+    xz = "xz"
+    zstd = "zstd"
+
+    @classmethod
+    def infer(cls, path: str) -> Optional["Compression"]:
+        """Infers the compression of a file from its extension, i.e. `records.jsonl.gz` -> `Compression.gzip`"""
+        return EXTENSIONS.get(os.path.splitext(path)[1].lower())
+
+    def compressor(self, level: Optional[int] = None) -> Any:
+        if self == Compression.gzip:
+            if level is None:
+                level = zlib.Z_DEFAULT_COMPRESSION
+            return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        if self == Compression.bz2:
+            return bz2.BZ2Compressor(9 if level is None else level)
+        if self == Compression.xz:
+            return lzma.LZMACompressor(preset=level)
+        return (
+            _zstandard()
+            .ZstdCompressor(level=3 if level is None else level)
+            .compressobj()
+        )
+
+    def decompressor(self) -> Any:
+        if self == Compression.gzip:
+            return zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if self == Compression.bz2:
+            return bz2.BZ2Decompressor()
+        if self == Compression.xz:
+            return lzma.LZMADecompressor()
+        return _zstandard().ZstdDecompressor().decompressobj()
+
+
+EXTENSIONS = {
+    ".gz": Compression.gzip,
+    ".gzip": Compression.gzip,
+    ".bz2": Compression.bz2,
+    ".xz": Compression.xz,
+    ".zst": Compression.zstd,
+    ".zstd": Compression.zstd,
+}
+
+
+def _zstandard() -> Any:
+    if zstandard is None:
+        raise ImportError(
+            'zstandard must be installed to read or write zstd files: pip install "quadipy[zstd]"'
+        )
+    return zstandard
+
+
+class ThreadedDecompressor(io.RawIOBase):
+    """Reads a compressed file, decompressing it in a background thread
+
+    The thread reads `chunk_size` bytes at a time and decompresses them ahead of the reader into a queue of at
+    most `buffer_chunks` chunks of at most `chunk_size` bytes each, so decompression overlaps with whatever the
+    reader does with the data while the buffered data stays bounded.
+    Concatenated streams (i.e. `cat a.gz b.gz`) are read as one.
+    """
+
+    def __init__(
+        self,
+        raw: BinaryIO,
+        compression: Compression,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        buffer_chunks: int = DEFAULT_BUFFER_CHUNKS,
+    ) -> None:
+        super().__init__()
+        self._raw = raw
+        self._compression = compression
+        self._chunk_size = chunk_size
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=buffer_chunks)
+        self._stop = threading.Event()
+        self._chunk = memoryview(b"")
+        self._eof = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if not self._chunk:
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if item is _EOF:
+                self._eof = True
+                return 0
+            if isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            self._chunk = memoryview(item)
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self._raw.close()
+        super().close()
+
+    def _put(self, item: Any) -> None:
+        # Stop blocking on a full queue once the reader is closed, so the thread can exit
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _run(self) -> None:
+        try:
+            decompressor = self._compression.decompressor()
+            in_stream = False
+            while not self._stop.is_set():
+                data = self._raw.read(self._chunk_size)
+                if not data:
+                    break
+                while data:
+                    in_stream = True
+                    for output in _decompress(
+                        self._compression, decompressor, data, self._chunk_size
+                    ):
+                        if self._stop.is_set():
+                            return
+                        self._put(output)
+                    data = b""
+                    if decompressor.eof:
+                        in_stream = False
+                        data = decompressor.unused_data
+                        decompressor = self._compression.decompressor()
+            if in_stream:
+                raise EOFError(
+                    "Compressed file ended before the end-of-stream marker was reached"
+                )
+            self._put(_EOF)
+        except BaseException as exc:
+            self._put(exc)
+
+
+def _decompress(
+    compression: Compression, decompressor: Any, data: bytes, max_length: int
+) -> Iterator[bytes]:
+    """Decompresses `data` into chunks of at most `max_length` bytes, until the input or the stream ends
+
+    Capping each chunk keeps the decompressor's queue bounded in bytes even for highly compressible data.
+    zstandard's decompressor doesn't take a `max_length`, so zstd chunks are only bounded by `data`'s content.
+    """
+    while True:
+        if compression == Compression.gzip:
+            # zlib hands back the input it didn't get to, and may still hold output once all input is consumed
+            output = decompressor.decompress(data, max_length)
+            data = decompressor.unconsumed_tail
+            more = bool(data) or len(output) == max_length
+        elif compression != Compression.zstd:
+            # bz2 and lzma keep the input they didn't get to internally
+            output = decompressor.decompress(data, max_length=max_length)
+            data = b""
+            more = not decompressor.needs_input
+        else:
+            output = decompressor.decompress(data)
+            more = False
+        if output:
+            yield output
+        if decompressor.eof or not more:
+            return
+
+
+class ThreadedCompressor(io.RawIOBase):
+    """Writes a compressed file, compressing it in a background thread
+
+    Written data is handed to a queue of at most `buffer_chunks` chunks and compressed by the thread, so
+    compression overlaps with whatever produces the data. Errors raised by the thread are re-raised on the next
+    `write`, `flush` or `close`.
+    """
+
+    def __init__(
+        self,
+        raw: BinaryIO,
+        compression: Compression,
+        level: Optional[int] = None,
+        buffer_chunks: int = DEFAULT_BUFFER_CHUNKS,
+    ) -> None:
+        super().__init__()
+        self._raw = raw
+        self._compressor = compression.compressor(level)
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=buffer_chunks)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._raise_error()
+        chunk = bytes(data)
+        self._queue.put(chunk)
+        return len(chunk)
+
+    def flush(self) -> None:
+        """Waits until everything written so far has been compressed and handed to the underlying file"""
+        if not self.closed:
+            self._queue.join()
+            self._raise_error()
+            self._raw.flush()
+        super().flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self._queue.put(_EOF)
+            self._thread.join()
+        finally:
+            try:
+                # Flushing re-raises any error the thread ran into
+                super().close()
+            finally:
+                self._raw.close()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                # Once an error happened, keep draining the queue so writers never block forever
+                if self._error is None:
+                    if item is _EOF:
+                        self._raw.write(self._compressor.flush())
+                    else:
+                        self._raw.write(self._compressor.compress(item))
+            except BaseException as exc:
+                self._error = exc
+            finally:
+                self._queue.task_done()
+            if item is _EOF:
+                return
+
+
+def open_compressed(
+    path: str,
+    mode: str = "rb",
+    compression: Union[Compression, str, None] = "infer",
+    level: Optional[int] = None,
+    encoding: str = "utf-8",
+    newline: Optional[str] = None,
+    buffer_chunks: int = DEFAULT_BUFFER_CHUNKS,
+) -> IO:
+    """Opens a file, transparently compressing or decompressing it in a background thread
+
+    Examples:
+        with open_compressed("records.jsonl.gz", "rt") as f:
+            for line in f:
+                ...
+
+    Args:
+        path: The path of the file
+        mode: One of `rb`, `wb`, `rt` or `wt` (`r` and `w` are read as text)
+        compression: A `Compression`, `None` for an uncompressed file, or `infer` to infer it from the file extension
+        level: The compression level used when writing, defaults to the codec's own default
+        encoding: The encoding used in text mode
+        newline: How line endings are handled in text mode, see `open`
+        buffer_chunks: The max number of chunks buffered between the caller and the codec thread
+
+    Returns:
+        A buffered binary file object, or a text file object in text mode
+
+    Raises:
+        ValueError: If the mode isn't supported
+        ImportError: If the file is zstd compressed and `zstandard` isn't installed
+    """
+    if mode not in ("r", "w", "rb", "wb", "rt", "wt"):
+        raise ValueError(f"{mode} isn't a supported mode")
+    if compression == "infer":
+        compression = Compression.infer(path)
+    elif compression is not None:
+        compression = Compression(compression)
+    binary = "b" in mode
+    writing = mode.startswith("w")
+    if compression is None:
+        if binary:
+            return open(path, mode)
+        return open(path, mode, encoding=encoding, newline=newline)
+    stream: BinaryIO
+    if writing:
+        stream = io.BufferedWriter(
+            ThreadedCompressor(open(path, "wb"), compression, level, buffer_chunks),
+            buffer_size=DEFAULT_CHUNK_SIZE,
+        )
+    else:
+        stream = io.BufferedReader(
+            ThreadedDecompressor(
+                open(path, "rb"), compression, buffer_chunks=buffer_chunks
+            ),
+            buffer_size=DEFAULT_CHUNK_SIZE,
+        )
+    if binary:
+        return stream
+    return io.TextIOWrapper(stream, encoding=encoding, newline=newline)
@@ -0,0 +1,115 @@
+import itertools
+import logging
+import os
+from typing import Dict, Iterable, Optional
+
+from pydantic import BaseModel
+
+from quadipy.compression import Compression
+from quadipy.schemas.graph_format_config import GraphFormatConfig
+from quadipy.sinks.nquads import NQuadsFileSink
+
+
+class Checkpoint(BaseModel):
+    """Progress of an `IngestionJob` that has been durably committed
+
+    Attributes:
+        offset: Number of input records that have been quadified and written
+        quads_written: Number of quads written to the output file
+        output_position: Byte position of the output file that matches `offset`
+        completed: Whether the job ran through the whole input
+    """
+
+    offset: int = 0
+    quads_written: int = 0
+    output_position: int = 0
+    completed: bool = False
+
+
+class IngestionJob:
+    """Quadifies records into an N-Quads file, committing checkpoints so that a crashed run can be resumed
+
+    Every `checkpoint_every` records the output file is flushed and synced to disk, then a `Checkpoint` is
+    atomically written next to it. When the job is run again, it truncates the output back to the last checkpoint,
+    skips the records that were already written and carries on from there, so every record ends up in the output
+    exactly once. The records passed to `run` must therefore be replayed in the same order on every attempt.
+
+    Examples:
+        job = IngestionJob(config, "output.nq", "output.nq.checkpoint")
+        checkpoint = job.run(read_records())
+
+    Attributes:
+        config: The config used to quadify each record
+        output_path: The N-Quads file the quads are written to
+        checkpoint_path: The JSON file the checkpoint is stored in
+        checkpoint_every: Number of records processed between two checkpoints
+    """
+
+    def __init__(
+        self,
+        config: GraphFormatConfig,
+        output_path: str,
+        checkpoint_path: str,
+        checkpoint_every: int = 10000,
+    ) -> None:
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+        if Compression.infer(output_path):
+            raise ValueError(
+                f"{output_path} can't be compressed, checkpoints need to truncate the output in place"
+            )
+        self.config = config
+        self.output_path = output_path
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+
+    def load_checkpoint(self) -> Optional[Checkpoint]:
+        """Returns the last committed checkpoint, or None if the job never committed one"""
+        if not os.path.exists(self.checkpoint_path):
+            return None
+        return Checkpoint.parse_file(self.checkpoint_path)
+
+    def commit(self, sink: NQuadsFileSink, checkpoint: Checkpoint) -> None:
+        """Durably writes the checkpoint once everything it accounts for is on disk"""
+        sink.flush()
+        checkpoint.output_position = sink.position
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(checkpoint.json())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def run(self, records: Iterable[Dict]) -> Checkpoint:
+        """Quadifies the records into `output_path`, resuming from the last checkpoint if there is one
+
+        Args:
+            records: The records to quadify, in the same order as any previous attempt of this job
+
+        Returns:
+            The final checkpoint of the job
+
+        Raises:
+            ValueError: If a checkpoint exists but the output file is missing or shorter than the checkpoint
+        """
+        checkpoint = self.load_checkpoint()
+        if checkpoint is None:
+            checkpoint = Checkpoint()
+            position = None
+        else:
+            logging.info(f"Resuming {self.output_path} from record {checkpoint.offset}")
+            position = checkpoint.output_position
+        with NQuadsFileSink(self.output_path, position=position) as sink:
+            pending = 0
+            for record in itertools.islice(records, checkpoint.offset, None):
+                quads = self.config.quadify(record)
+                sink.add(quads)
+                checkpoint.quads_written += len(quads)
+                checkpoint.offset += 1
+                pending += 1
+                if pending >= self.checkpoint_every:
+                    self.commit(sink, checkpoint)
+                    pending = 0
+            checkpoint.completed = True
+            self.commit(sink, checkpoint)
+        return checkpoint
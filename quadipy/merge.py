@@ -0,0 +1,143 @@
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from rdflib import URIRef
+from rdflib.term import Node
+
+from quadipy.schemas.graph_format_config import GraphFormatConfig
+from quadipy.schemas.quad import Quad
+
+DEFAULT_WINDOW = 10000
+
+EntityKey = Tuple[URIRef, Optional[URIRef]]
+
+
+def _is_list_like(value: Any) -> bool:
+    """Whether quadify expands the value into items, as a python list or a JSON encoded list"""
+    return isinstance(value, list) or (
+        isinstance(value, str) and bool(value) and value[0] == "["
+    )
+
+
+def _items(value: Any) -> Iterator[Tuple[Any, Any]]:
+    """Expands python lists and JSON encoded lists the way `GraphFormatConfig.quadify` does
+
+    Like `quadify`, items of python lists are expanded again but the items of a decoded JSON list aren't.
+
+    Returns:
+        An iterator over the items and the values to hold in the merged record for them, which quadify to the same
+        object as the item
+    """
+    if isinstance(value, list):
+        for item in value:
+            yield from _items(item)
+        return
+    if isinstance(value, str) and value and value[0] == "[":
+        try:
+            decoded = json.loads(value)
+        except json.decoder.JSONDecodeError:
+            yield value, value
+            return
+        for item in decoded:
+            # Re-encoded, so that quadifying the merged record doesn't expand the item once more
+            yield item, json.dumps([item]) if _is_list_like(item) else item
+        return
+    yield value, value
+
+
+class _Entity:
+    """Values of all the records of a subject and named graph seen so far"""
+
+    def __init__(self, config: GraphFormatConfig, record: Dict) -> None:
+        self.config = config
+        self.merged = {config.primary_key: config.value(record, config.primary_key)}
+        if config.date_field:
+            self.merged[config.date_field] = config.value(record, config.date_field)
+        # Values are keyed by the object they quadify to, so that i.e. "1" and 1 in an integer column or an item
+        # repeated across JSON lists are kept once, while True and 1 in a literal column stay distinct
+        self.values: Dict[str, Dict[Node, Any]] = {}
+        self.add(record)
+
+    def add(self, record: Dict) -> None:
+        for col_name in self.config.predicate_mapping:
+            value = self.config.value(record, col_name)
+            if value is None:
+                continue
+            values = self.values.setdefault(col_name, {})
+            for item, merged_item in _items(value):
+                obj = self.config.obj_from_value(col_name, item)
+                if obj is not None and str(obj) and obj not in values:
+                    values[obj] = merged_item
+
+    def record(self) -> Dict:
+        # Merged records are flat, which compiled accessors read before trying nested paths
+        merged = dict(self.merged)
+        for col_name, values in self.values.items():
+            if values:
+                items = list(values.values())
+                merged[col_name] = items[0] if len(items) == 1 else items
+        return merged
+
+
+def _entity_key(config: GraphFormatConfig, record: Dict) -> EntityKey:
+    return config.subject(record), config.named_graph(record)
+
+
+def merge_records(
+    config: GraphFormatConfig,
+    records: Iterable[Dict],
+    window: int = DEFAULT_WINDOW,
+    sorted_input: bool = False,
+) -> Iterator[Dict]:
+    """Merges the records of each subject and named graph into a single record
+
+    Sources often emit several partial rows for the same `primary_key`, i.e. one per update or per joined child
+    row. The merged record holds every value of each `predicate_mapping` column that quadifies to a distinct object,
+    as a list when the rows disagree, so that quadifying it produces each fact once. JSON encoded lists are
+    expanded into their items.
+
+    Records are grouped within a window of `window` distinct entities: when a new entity doesn't fit, the entity
+    seen first is merged and emitted. Rows of an entity further apart than the window are emitted as more than one
+    record, which still produces correct, if duplicated, quads. When the input is sorted (or grouped) by
+    `primary_key`, pass `sorted_input` to emit each entity as soon as its last row is read.
+
+    Args:
+        config: The config the records will be quadified with
+        records: The records to merge
+        window: Max number of entities buffered at once
+        sorted_input: Whether the records of each entity are contiguous in the input
+
+    Returns:
+        An iterator over the merged records, in the order their entity first appeared
+
+    Raises:
+        ValueError: If `window` is lower than 1
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    if sorted_input:
+        window = 1
+    entities: "OrderedDict[EntityKey, _Entity]" = OrderedDict()
+    for record in records:
+        key = _entity_key(config, record)
+        entity = entities.get(key)
+        if entity is not None:
+            entity.add(record)
+            continue
+        if len(entities) >= window:
+            yield entities.popitem(last=False)[1].record()
+        entities[key] = _Entity(config, record)
+    for entity in entities.values():
+        yield entity.record()
+
+
+def quadify_merged(
+    config: GraphFormatConfig,
+    records: Iterable[Dict],
+    window: int = DEFAULT_WINDOW,
+    sorted_input: bool = False,
+) -> Iterator[Quad]:
+    """Merges the records of each entity, see `merge_records`, and quadifies each entity once"""
+    for record in merge_records(config, records, window, sorted_input):
+        yield from config.quadify(record)
@@ -0,0 +1,151 @@
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set
+
+from pydantic import BaseModel
+from rdflib import URIRef
+from rdflib.term import Node
+
+from quadipy.schemas.graph_format_config import GraphFormatConfig
+
+
+class PredicateProfile(BaseModel):
+    """Output profile of a single predicate
+
+    Attributes:
+        predicate_uri: The predicate
+        columns: The `predicate_mapping` columns mapped to the predicate
+        quads: Number of quads with the predicate
+        records: Number of records that produced at least one quad with the predicate
+    """
+
+    predicate_uri: URIRef
+    columns: List[str] = []
+    quads: int = 0
+    records: int = 0
+
+    class Config:
+        """Pydantic config class"""
+
+        arbitrary_types_allowed = True
+
+
+class ProfileReport(BaseModel):
+    """Measured output of a `GraphFormatConfig` over a sample of records, and projections for the full input
+
+    Attributes:
+        records: Number of records sampled
+        quads: Number of quads produced from the sample
+        bytes: Size of the sample's quads serialized as N-Quads
+        read_seconds: Time spent reading the sample's records, including parsing and decompressing them
+        quadify_seconds: Time spent quadifying the sample's records
+        distinct_subjects: Number of distinct subjects in the sample
+        distinct_graphs: Number of distinct named graphs in the sample
+        predicates: Profile of each predicate of the `predicate_mapping`
+        total_records: Number of records in the full input, used to project the output of a full run
+    """
+
+    records: int = 0
+    quads: int = 0
+    bytes: int = 0
+    read_seconds: float = 0.0
+    quadify_seconds: float = 0.0
+    distinct_subjects: int = 0
+    distinct_graphs: int = 0
+    predicates: Dict[URIRef, PredicateProfile] = {}
+    total_records: Optional[int]
+
+    class Config:
+        """Pydantic config class"""
+
+        arbitrary_types_allowed = True
+
+    @property
+    def seconds(self) -> float:
+        return self.read_seconds + self.quadify_seconds
+
+    @property
+    def quads_per_record(self) -> float:
+        return self.quads / self.records if self.records else 0.0
+
+    @property
+    def bytes_per_quad(self) -> float:
+        return self.bytes / self.quads if self.quads else 0.0
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds else 0.0
+
+    @property
+    def estimated_quads(self) -> Optional[int]:
+        if self.total_records is None:
+            return None
+        return round(self.quads_per_record * self.total_records)
+
+    @property
+    def estimated_bytes(self) -> Optional[int]:
+        if self.total_records is None or not self.records:
+            return None
+        return round(self.bytes / self.records * self.total_records)
+
+    @property
+    def estimated_seconds(self) -> Optional[float]:
+        if self.total_records is None or not self.records:
+            return None
+        return self.seconds / self.records * self.total_records
+
+
+def profile_config(
+    config: GraphFormatConfig,
+    records: Iterable[Dict],
+    sample_size: int = 10000,
+    total_records: Optional[int] = None,
+) -> ProfileReport:
+    """Runs a config over the first records of an input to estimate what a full run will produce
+
+    Reading and quadifying the records are timed separately, and the runtime projection is based on both.
+    Serializing the quads to measure their size isn't timed.
+
+    Args:
+        config: The config to profile
+        records: The input records, only the first `sample_size` are read
+        sample_size: Number of records to sample
+        total_records: Number of records in the full input. When it isn't given and the input has fewer than
+            `sample_size` records, the whole input was sampled and the sample size is used instead
+
+    Returns:
+        A `ProfileReport` of the sample, with projections for `total_records`
+    """
+    report = ProfileReport(total_records=total_records)
+    for col_name, mapping in config.predicate_mapping.items():
+        predicate = report.predicates.setdefault(
+            mapping.predicate_uri, PredicateProfile(predicate_uri=mapping.predicate_uri)
+        )
+        predicate.columns.append(col_name)
+    subjects: Set[Node] = set()
+    graphs: Set[Optional[URIRef]] = set()
+    iterator = iter(records)
+    while report.records < sample_size:
+        started_at = time.perf_counter()
+        record = next(iterator, None)
+        report.read_seconds += time.perf_counter() - started_at
+        if record is None:
+            break
+        started_at = time.perf_counter()
+        quads = config.quadify(record)
+        report.quadify_seconds += time.perf_counter() - started_at
+        report.records += 1
+        report.quads += len(quads)
+        report.bytes += sum(len(quad.to_nquad().encode("utf-8")) for quad in quads)
+        counts = Counter(quad.predicate for quad in quads)
+        for predicate_uri, count in counts.items():
+            predicate = report.predicates[predicate_uri]
+            predicate.quads += count
+            predicate.records += 1
+        subjects.update(quad.subject for quad in quads)
+        graphs.update(quad.graph for quad in quads)
+    report.distinct_subjects = len(subjects)
+    report.distinct_graphs = len(graphs - {None})
+    if report.total_records is None and report.records < sample_size:
+        report.total_records = report.records
+    return report
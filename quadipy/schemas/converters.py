@@ -0,0 +1,68 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from rdflib import XSD, Literal
+
+TRUE_VALUES = {"true", "1", "yes", "y", "t"}
+FALSE_VALUES = {"false", "0", "no", "n", "f"}
+
+CONVERSION_ERRORS = (ValueError, TypeError, ArithmeticError)
+"""Errors raised by converters when a value can't be converted to their datatype"""
+
+
+def to_integer(value: Any) -> Literal:
+    """Converts ints, integral floats and decimals, and integer strings like `" 42 "` to an `xsd:integer` Literal"""
+    if isinstance(value, bool):
+        raise TypeError(f"{value} isn't an integer")
+    if isinstance(value, (float, Decimal)) and value != int(value):
+        raise ValueError(f"{value} isn't an integer")
+    return Literal(int(value), datatype=XSD.integer)
+
+
+def to_decimal(value: Any) -> Literal:
+    """Converts numbers and numeric strings to an `xsd:decimal` Literal, keeping the precision of strings"""
+    if isinstance(value, bool):
+        raise TypeError(f"{value} isn't a decimal")
+    number = value if isinstance(value, Decimal) else Decimal(str(value).strip())
+    if not number.is_finite():
+        raise ValueError(f"{value} isn't a finite decimal")
+    return Literal(number, datatype=XSD.decimal)
+
+
+def to_boolean(value: Any) -> Literal:
+    """Converts bools, 0 / 1 and strings like `true`, `False` or `yes` to an `xsd:boolean` Literal"""
+    if isinstance(value, bool):
+        return Literal(value)
+    if isinstance(value, int) and value in (0, 1):
+        return Literal(bool(value))
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in TRUE_VALUES:
+            return Literal(True)
+        if lowered in FALSE_VALUES:
+            return Literal(False)
+    raise ValueError(f"{value} isn't a boolean")
+
+
+def to_date(value: Any) -> Literal:
+    """Converts dates, datetimes and ISO 8601 strings like `2022-01-01` to an `xsd:date` Literal"""
+    if isinstance(value, datetime):
+        value = value.date()
+    elif not isinstance(value, date):
+        if not isinstance(value, str):
+            raise TypeError(f"{value} isn't a date")
+        value = date.fromisoformat(value.strip())
+    return Literal(value, datatype=XSD.date)
+
+
+def to_datetime(value: Any) -> Literal:
+    """Converts datetimes and ISO 8601 strings like `2022-01-01T12:00:00Z` to an `xsd:dateTime` Literal"""
+    if not isinstance(value, datetime):
+        if isinstance(value, date) or not isinstance(value, str):
+            raise TypeError(f"{value} isn't a datetime")
+        text = value.strip()
+        if text.endswith("Z"):
+            text = f"{text[:-1]}+00:00"
+        value = datetime.fromisoformat(text)
+    return Literal(value, datatype=XSD.dateTime)
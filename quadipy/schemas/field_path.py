@@ -0,0 +1,126 @@
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+Step = Union[str, int]
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __reduce__(self) -> str:
+        # Unpickles to the module's singleton, so that `is MISSING` checks keep working in other processes
+        return "MISSING"
+
+
+MISSING = _Missing()
+"""Sentinel returned by accessors compiled with `default=MISSING` when the path doesn't exist in the record"""
+
+_STEP_PATTERN = re.compile(
+    r"""\.?(?P<key>[^.\[\]]+)|\[(?P<index>-?\d+)\]|\[(?P<quote>['"])(?P<quoted>.*?)(?P=quote)\]"""
+)
+
+
+def parse_field_path(path: str) -> List[Step]:
+    """Parses a dotted / JSON-path style field path into the keys and indexes to traverse
+
+    Examples:
+        "id" -> ["id"]
+        "company.address.city" -> ["company", "address", "city"]
+        "$.founders[0].name" -> ["founders", 0, "name"]
+        "attributes['first.name']" -> ["attributes", "first.name"]
+
+    Args:
+        path: The path to parse, optionally prefixed with the JSON-path root `$`
+
+    Returns:
+        The list of steps, where strings are dictionary keys and integers are list indexes
+
+    Raises:
+        ValueError: If the path is empty or malformed
+    """
+    body = path
+    if path.startswith("$"):
+        body = path[2:] if path.startswith("$.") else path[1:]
+    steps: List[Step] = []
+    position = 0
+    while position < len(body):
+        match = _STEP_PATTERN.match(body, position)
+        if not match or (position == 0 and body.startswith(".")):
+            raise ValueError(f"{path} isn't a valid field path")
+        if match.group("key") is not None:
+            steps.append(match.group("key"))
+        elif match.group("index") is not None:
+            steps.append(int(match.group("index")))
+        else:
+            steps.append(match.group("quoted"))
+        position = match.end()
+    if not steps:
+        raise ValueError(f"{path} isn't a valid field path")
+    return steps
+
+
+class Accessor:
+    """Reads a field path from a record, see `compile_accessor`
+
+    Accessors are module level objects rather than closures so that the configs holding them can be pickled,
+    i.e. to hand a config to multiprocessing workers.
+    """
+
+    __slots__ = ("path", "steps", "default")
+
+    def __init__(
+        self, path: str, steps: Optional[List[Step]], default: Any = None
+    ) -> None:
+        self.path = path
+        # Keys only apply to dicts and indexes to lists, so i.e. `tags[0]` doesn't index into a `tags` string
+        self.steps: Optional[List[Tuple[Step, Any]]] = (
+            None
+            if steps is None
+            else [
+                (step, (list, tuple) if isinstance(step, int) else dict)
+                for step in steps
+            ]
+        )
+        self.default = default
+
+    def __call__(self, record: Dict) -> Any:
+        if self.steps is None:
+            return record.get(self.path, self.default)
+        value: Any = record.get(self.path, MISSING)
+        if value is not MISSING:
+            return value
+        value = record
+        try:
+            for step, container in self.steps:
+                if not isinstance(value, container):
+                    return self.default
+                value = value[step]
+        except (KeyError, IndexError):
+            return self.default
+        return value
+
+
+def compile_accessor(path: str, default: Any = None) -> Accessor:
+    """Compiles a field path into an `Accessor` that reads that field from a record
+
+    Plain keys compile to a single `dict.get`. Nested paths are parsed once here so that reading a
+    record only walks the precomputed steps, instead of flattening nested records into new dicts.
+    A key that literally matches the full path (i.e. an already flattened `"company.name"` column)
+    takes precedence over the nested lookup, so existing flat configs keep working. Keys that aren't
+    valid paths (i.e. `"Revenue [USD]"`) are read as plain keys.
+
+    Args:
+        path: A field path, see `parse_field_path`
+        default: The value returned when the path doesn't exist in the record
+
+    Returns:
+        An `Accessor` that takes a record and returns the value at `path`
+    """
+    try:
+        steps: Optional[List[Step]] = parse_field_path(path)
+    except ValueError:
+        steps = None
+    if steps == [path]:
+        steps = None
+    return Accessor(path, steps, default)
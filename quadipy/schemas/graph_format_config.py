@@ -1,15 +1,18 @@
 import json
 import logging
 from datetime import date, datetime
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
-from pydantic import BaseModel, Extra, validator
+from pydantic import BaseModel, Extra, PrivateAttr, validator
 from rdflib import Literal, Namespace, URIRef
 
 from quadipy.schemas import format_namespace
+from quadipy.schemas.field_path import MISSING, Accessor, compile_accessor
 from quadipy.schemas.predicate_mapping import PredicateMapping
 from quadipy.schemas.quad import Quad
 
+ConfigT = TypeVar("ConfigT", bound="GraphFormatConfig")
+
 
 class GraphFormatConfig(BaseModel):
     """Graph formatting configuration class
@@ -19,8 +22,10 @@ class GraphFormatConfig(BaseModel):
 
     Attributes:
         source_name: A string that is used to describe the source (i.e. "wikipedia" for data from wikipedia)
-        predicate_mapping: A dictionary that maps the column_name to a predicate in URI form
-        primary_key: The primary key of the row (usually something like `id`) that will the subject of every quad
+        predicate_mapping: A dictionary that maps the column_name to a predicate in URI form. Column names can be
+            dotted / JSON-path style paths into nested records (i.e. `company.address.city` or `founders[0].name`)
+        primary_key: The primary key of the row (usually something like `id`) that will the subject of every quad.
+            Can be a path into nested records like `predicate_mapping` keys
         subject_namespace: A string prepended to the quad's subject as a namespace, instead of just using the value of the `primary_key`.
         graph_namespace: Similar to `subject_namespace` in that this will assign each fact to a named graph with the `graph_namespace`.
         date_field: The column in your dataset that the fact's "date" will be pulled from. When specified, the named graph field in each fact will be build from the date.
@@ -32,6 +37,10 @@ class GraphFormatConfig(BaseModel):
     subject_namespace: Optional[Namespace]
     graph_namespace: Optional[Namespace]
     date_field: Optional[str]
+    _accessors: Dict[str, Accessor] = PrivateAttr()
+    _field_accessors: Dict[str, Accessor] = PrivateAttr()
+    _primary_key_accessor: Accessor = PrivateAttr()
+    _date_field_accessor: Optional[Accessor] = PrivateAttr()
 
     class Config:
         """Pydantic config class"""
@@ -40,6 +49,36 @@ class GraphFormatConfig(BaseModel):
         allow_mutation = False
         extra = Extra.allow
 
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        self._compile_accessors()
+
+    def _compile_accessors(self) -> None:
+        # Field paths are compiled once here so reading a record never has to parse them again
+        self._accessors = {
+            col_name: compile_accessor(col_name) for col_name in self.predicate_mapping
+        }
+        self._field_accessors = dict(self._accessors)
+        for field in (self.primary_key, self.date_field):
+            if field and field not in self._field_accessors:
+                self._field_accessors[field] = compile_accessor(field)
+        self._primary_key_accessor = compile_accessor(self.primary_key, MISSING)
+        self._date_field_accessor = (
+            compile_accessor(self.date_field, MISSING) if self.date_field else None
+        )
+
+    def copy(self: ConfigT, **kwargs: Any) -> ConfigT:
+        # Copies skip __init__, so the accessors are compiled again for the copy's (possibly updated) fields
+        config = super().copy(**kwargs)
+        config._compile_accessors()
+        return config
+
+    @classmethod
+    def construct(cls: Type[ConfigT], *args: Any, **kwargs: Any) -> ConfigT:
+        config = super().construct(*args, **kwargs)
+        config._compile_accessors()
+        return config
+
     @validator("subject_namespace")
     @classmethod
     def _validate_subject_namespace(cls, value: Optional[str]) -> Optional[Namespace]:
@@ -62,21 +101,40 @@ class GraphFormatConfig(BaseModel):
         Raises:
             AssertionError: The `record` provided lacked the `primary_key` field
         """
+        value = self._primary_key_accessor(record)
         assert (
-            self.primary_key in record
+            value is not MISSING
         ), f"{self.primary_key} isn't defined in {record}! Each record must have a defined primary key"
-        primary_key = str(record[self.primary_key])
+        primary_key = str(value)
         if self.subject_namespace:
             return self.subject_namespace[primary_key]
         return URIRef(primary_key)
 
+    def value(self, record: Dict, col_name: str) -> Any:
+        """Reads the value of a `predicate_mapping` column, the `primary_key` or the `date_field` from the record
+
+        Returns:
+            The value read using the field's compiled accessor, or None if the record doesn't have the field
+        """
+        accessor = self._field_accessors.get(col_name)
+        if accessor:
+            return accessor(record)
+        return record.get(col_name)
+
     def obj(self, record: Dict, col_name: str) -> Optional[Union[Literal, URIRef]]:
-        value = record.get(col_name)
-        if value is not None:
-            predicate_mapping = self.predicate_mapping[col_name]
-            obj_value = predicate_mapping.obj_datatype.value(value)
-            return self.add_namespace_to_obj(col_name, obj_value)
-        return None
+        return self.obj_from_value(col_name, self.value(record, col_name))
+
+    def obj_from_value(
+        self, col_name: str, value: Any
+    ) -> Optional[Union[Literal, URIRef]]:
+        """Converts a value of `col_name` into the object of a quad, following its `PredicateMapping`
+
+        Returns:
+            The object, or None if the value is None or can't be converted to the column's datatype
+        """
+        if value is None:
+            return None
+        return self.predicate_mapping[col_name].convert(value)
 
     def add_namespace_to_obj(
         self, col_name: str, obj_value: Union[Literal, URIRef]
@@ -95,14 +153,17 @@ class GraphFormatConfig(BaseModel):
             return URIRef(graph.strip("/"))
         return None
 
-    def _validate_record_has_date_field(self, record: Dict) -> None:
+    def _validate_record_has_date_field(self, record: Dict) -> Any:
+        date_value = MISSING
+        if self._date_field_accessor:
+            date_value = self._date_field_accessor(record)
         assert (
-            self.date_field in record
+            date_value is not MISSING
         ), f"{self.date_field} must be defined in {record} in order to build record from date"
+        return date_value
 
     def validate_date_field_is_valid_format(self, record: Dict) -> str:
-        self._validate_record_has_date_field(record)
-        date_value = record[self.date_field]
+        date_value = self._validate_record_has_date_field(record)
         try:
             if isinstance(date_value, date):
                 dt = date_value
@@ -145,35 +206,116 @@ class GraphFormatConfig(BaseModel):
         self, col_name: str, predicate: URIRef, record: Dict
     ) -> Optional[Quad]:
         obj = self.obj(record, col_name)
-        if not obj:
+        if obj is None or not str(obj):
             return None
         subject = self.subject(record)
         graph = self.named_graph(record)
         return Quad.from_tuple((subject, predicate, obj, graph))
 
     def process_quad_list(
-        self, value: str, predicate_uri: URIRef, record: Dict
+        self,
+        value: str,
+        predicate_uri: URIRef,
+        record: Dict,
+        col_name: Optional[str] = None,
     ) -> List[Quad]:
-        quads = []
-        subject = self.subject(record)
-        graph = self.named_graph(record)
+        """Translates a JSON encoded list into one Quad per item, converted like the other values of its column
+
+        Args:
+            value: The JSON encoded list, i.e. `'["Biotech", "Diagnostics"]'`
+            predicate_uri: The predicate of the quads
+            record: The record the list was read from
+            col_name: The `predicate_mapping` column of the list, defaults to the first one mapped to `predicate_uri`
+
+        Returns:
+            A list of Quads, without the items that can't be converted to the column's datatype
+
+        Raises:
+            KeyError: If `col_name` isn't given and no column is mapped to `predicate_uri`
+        """
+        if col_name is None:
+            col_name = next(
+                (
+                    name
+                    for name, mapping in self.predicate_mapping.items()
+                    if mapping.predicate_uri == predicate_uri
+                ),
+                None,
+            )
+        if col_name is None:
+            raise KeyError(f"No column is mapped to {predicate_uri}")
+        return self._process_quad_list(
+            value, col_name, self.subject(record), self.named_graph(record)
+        )
+
+    def _process_quad_list(
+        self,
+        value: str,
+        col_name: str,
+        subject: URIRef,
+        graph: Optional[URIRef],
+    ) -> List[Quad]:
+        mapping = self.predicate_mapping[col_name]
         try:
-            val_list = json.loads(value)
-            for item in val_list:
-                quad = Quad.from_tuple((subject, predicate_uri, Literal(item), graph))
-                quads.append(quad)
+            objs = mapping.convert_many(json.loads(value))
         except SyntaxError:
             logging.info(f"Can't load list with value: {value}")
+            return []
         except json.decoder.JSONDecodeError:
-            quad = Quad.from_tuple((subject, predicate_uri, Literal(value), graph))
-            quads.append(quad)
-        return quads
+            objs = [mapping.convert(value)]
+        return [
+            Quad.from_tuple((subject, mapping.predicate_uri, obj, graph))
+            for obj in objs
+            if obj is not None and str(obj)
+        ]
+
+    def _entity(
+        self, record: Dict, cache: Dict[str, Any]
+    ) -> Tuple[URIRef, Optional[URIRef]]:
+        """Returns the subject and named graph of a record, only building them once per record"""
+        if not cache:
+            cache["subject"] = self.subject(record)
+            cache["graph"] = self.named_graph(record)
+        return cache["subject"], cache["graph"]
+
+    def _quadify_value(
+        self, record: Dict, col_name: str, value: Any, cache: Dict[str, Any]
+    ) -> List[Quad]:
+        if isinstance(value, list):
+            return [
+                quad
+                for item in value
+                for quad in self._quadify_value(record, col_name, item, cache)
+            ]
+        if isinstance(value, str) and value and value[0] == "[":
+            subject, graph = self._entity(record, cache)
+            return self._process_quad_list(value, col_name, subject, graph)
+        obj = self.obj_from_value(col_name, value)
+        if obj is None or not str(obj):
+            return []
+        subject, graph = self._entity(record, cache)
+        predicate_uri = self.predicate_mapping[col_name].predicate_uri
+        return [Quad.from_tuple((subject, predicate_uri, obj, graph))]
+
+    def quadify_column(self, record: Dict, col_name: str) -> List[Quad]:
+        """Translates a single column of a record into a list of Quads
+
+        Args:
+            record: A dictionary that contains the data to be quadified
+            col_name: A key of the `predicate_mapping`
+
+        Returns:
+            A list of Quads, empty if the column has no value in the record
+        """
+        value = self._accessors[col_name](record)
+        return self._quadify_value(record, col_name, value, {})
 
     def quadify(self, record: Dict) -> List[Quad]:
         """Takes a record and translates into a list of Quads
 
         This process is explained more in-depth in the README but this is the high level method that translates
-        a record into a list of Quads that can be inserted in an RDF graph
+        a record into a list of Quads that can be inserted in an RDF graph. Values that are lists, either python
+        lists or JSON encoded strings like `'["Biotech", "Diagnostics"]'`, produce one quad per item
 
         Args:
             record: A dictionary that contains the data to be quadified
@@ -182,16 +324,10 @@ class GraphFormatConfig(BaseModel):
             A list of Quads
         """
         quads = []
-        for col_name, predicate in self.predicate_mapping.items():
-            value = record.get(col_name)
-            if isinstance(value, str) and value and value[0] == "[":
-                quads.extend(
-                    self.process_quad_list(value, predicate.predicate_uri, record)
-                )
-            else:
-                quad = self.map_predicate_mapping_to_quad(
-                    col_name, predicate.predicate_uri, record
-                )
-                if quad:
-                    quads.append(quad)
+        # The subject and named graph are shared by every quad of the record, so they're only built once
+        cache: Dict[str, Any] = {}
+        for col_name, accessor in self._accessors.items():
+            value = accessor(record)
+            if value is not None:
+                quads.extend(self._quadify_value(record, col_name, value, cache))
         return quads
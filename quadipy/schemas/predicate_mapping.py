@@ -1,20 +1,37 @@
 from __future__ import annotations
 
+import logging
 from enum import Enum
 from functools import partial
-from typing import Any, Generator, Optional
+from typing import Any, Generator, Iterable, List, Optional, Type, TypeVar, Union
 
-from pydantic import BaseModel, validator
-from rdflib import XSD, Literal, Namespace, URIRef
+from pydantic import BaseModel, PrivateAttr, validator
+from rdflib import Literal, Namespace, URIRef
 from rdflib.term import _is_valid_uri
 
 from quadipy.schemas import format_namespace
+from quadipy.schemas.converters import (
+    CONVERSION_ERRORS,
+    to_boolean,
+    to_date,
+    to_datetime,
+    to_decimal,
+    to_integer,
+)
 
 
 class ObjectDataTypes(Enum):
     uri = URIRef
     literal = Literal
-    date = partial(Literal, datatype=XSD.date)
+    date = partial(to_date)
+    integer = partial(to_integer)
+    decimal = partial(to_decimal)
+    boolean = partial(to_boolean)
+    datetime = partial(to_datetime)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # Enums pickle by value by default, and the partial values don't compare equal once unpickled
+        return getattr, (self.__class__, self.name)
 
     @classmethod
     def __get_validators__(cls) -> Generator:
@@ -28,15 +45,50 @@ class ObjectDataTypes(Enum):
             return cls(value)
 
 
+class _Converter:
+    """Converts values to the objects of a `PredicateMapping`, see `PredicateMapping.convert`
+
+    The datatype, language and namespace are resolved once here instead of for every value. Converters are module
+    level objects rather than closures so that the mappings holding them can be pickled.
+    """
+
+    __slots__ = ("datatype", "language", "namespace")
+
+    def __init__(
+        self,
+        datatype: ObjectDataTypes,
+        language: Optional[str],
+        namespace: Optional[Namespace],
+    ) -> None:
+        self.datatype = datatype
+        self.language = language
+        self.namespace = namespace
+
+    def __call__(self, value: Any) -> Union[Literal, URIRef]:
+        if self.language:
+            return Literal(value, lang=self.language)
+        obj = self.datatype.value(value)
+        if self.namespace:
+            return self.namespace[obj]
+        return obj
+
+
+MappingT = TypeVar("MappingT", bound="PredicateMapping")
+
+
 class PredicateMapping(BaseModel):
     predicate_uri: URIRef
     obj_datatype: ObjectDataTypes = ObjectDataTypes.literal
     obj_namespace: Optional[Namespace]
+    obj_language: Optional[str]
+    _converter: _Converter = PrivateAttr()
     """Class to define relationship between data and predicate
 
     predicate_uri: The URI the data will be mapped to
-    obj_datatype: Datatype that the object will be serialized to defaults to literal but can be one of (literal, date, uri)
+    obj_datatype: Datatype that the object will be serialized to defaults to literal but can be one of
+        (literal, date, uri, integer, decimal, boolean, datetime)
     obj_namespace: If the object value should be mapped to a specific namespace
+    obj_language: Language tag of the object (i.e. `en`), only for literal objects
     """
 
     class Config:
@@ -45,6 +97,30 @@ class PredicateMapping(BaseModel):
         arbitrary_types_allowed = True
         allow_mutation = False
 
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        self._build_converter()
+
+    def _build_converter(self) -> None:
+        # Copies can update obj_datatype without validating it, so it's resolved again here
+        self._converter = _Converter(
+            ObjectDataTypes.validate(self.obj_datatype),
+            self.obj_language,
+            self.obj_namespace,
+        )
+
+    def copy(self: MappingT, **kwargs: Any) -> MappingT:
+        # Copies skip __init__, so the converter is built again for the copy's (possibly updated) fields
+        mapping = super().copy(**kwargs)
+        mapping._build_converter()
+        return mapping
+
+    @classmethod
+    def construct(cls: Type[MappingT], *args: Any, **kwargs: Any) -> MappingT:
+        mapping = super().construct(*args, **kwargs)
+        mapping._build_converter()
+        return mapping
+
     @validator("predicate_uri")
     @classmethod
     def _predicate_mapping_serialized_as_uri(cls, predicate_uri: Any) -> URIRef:
@@ -55,3 +131,55 @@ class PredicateMapping(BaseModel):
     @classmethod
     def _validate_obj_namespace(cls, value: Optional[str]) -> Optional[Namespace]:
         return format_namespace(value)
+
+    @validator("obj_language")
+    @classmethod
+    def _validate_obj_language(
+        cls, value: Optional[str], values: dict
+    ) -> Optional[str]:
+        if value is not None:
+            assert (
+                values.get("obj_datatype") == ObjectDataTypes.literal
+            ), "obj_language can only be used with the literal obj_datatype"
+            assert (
+                values.get("obj_namespace") is None
+            ), "obj_language can't be used with obj_namespace, which makes the object a URI"
+            Literal("", lang=value)
+        return value
+
+    def convert(self, value: Any) -> Optional[Union[Literal, URIRef]]:
+        """Converts a value to the object of a quad, following the datatype, language and namespace
+
+        Returns:
+            The converted object, or None if the value is None or can't be converted to the datatype
+        """
+        if value is None:
+            return None
+        converter = self._converter
+        try:
+            return converter(value)
+        except CONVERSION_ERRORS:
+            logging.info(f"Can't convert {value} to {converter.datatype.name}")
+            return None
+
+    def convert_many(
+        self, values: Iterable[Any]
+    ) -> List[Optional[Union[Literal, URIRef]]]:
+        """Converts a whole column of values at once, see `convert`
+
+        Returns:
+            A list with the converted object of each value, None for values that are None or can't be converted
+        """
+        converter = self._converter
+        objs: List[Optional[Union[Literal, URIRef]]] = []
+        append = objs.append
+        for value in values:
+            if value is None:
+                append(None)
+                continue
+            try:
+                append(converter(value))
+            except CONVERSION_ERRORS:
+                logging.info(f"Can't convert {value} to {converter.datatype.name}")
+                append(None)
+        return objs
@@ -4,6 +4,7 @@ from typing import Any, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel, validator
 from rdflib import BNode, Literal, URIRef
+from rdflib.plugins.serializers.nt import _quoteLiteral
 
 
 class Quad(BaseModel):
@@ -67,6 +68,20 @@ class Quad(BaseModel):
             return (self.subject, self.predicate, self.obj, self.graph)
         return (self.subject, self.predicate, self.obj)
 
+    def to_ntriple(self) -> str:
+        """Serializes the subject, predicate and object as a single N-Triples line, ignoring the graph"""
+        if isinstance(self.obj, Literal):
+            obj = _quoteLiteral(self.obj)
+        else:
+            obj = self.obj.n3()
+        return f"{self.subject.n3()} {self.predicate.n3()} {obj} .\n"
+
+    def to_nquad(self) -> str:
+        """Serializes the quad as a single N-Quads line. Quads without a graph are written to the default graph"""
+        if self.graph:
+            return f"{self.to_ntriple()[:-3]} {self.graph.n3()} .\n"
+        return self.to_ntriple()
+
     @staticmethod
     def _validate_value_type(value: Any, types: Tuple[Type, ...]) -> Any:
         """Validates the value are the correct data type
@@ -0,0 +1,11 @@
+from quadipy.sinks.nquads import NQuadsFileSink
+from quadipy.sinks.sparql import SparqlProtocol, SparqlSink, SparqlSinkError
+from quadipy.sinks.stats import SinkStats
+
+__all__ = [
+    "NQuadsFileSink",
+    "SinkStats",
+    "SparqlProtocol",
+    "SparqlSink",
+    "SparqlSinkError",
+]
@@ -0,0 +1,100 @@
+import os
+import time
+from typing import IO, Iterable, Optional, Union
+
+from quadipy.compression import Compression, open_compressed
+from quadipy.schemas.quad import Quad
+from quadipy.sinks.stats import SinkStats
+
+
+class NQuadsFileSink:
+    """Writes quads to a local N-Quads file, optionally compressed
+
+    Compression is inferred from the file extension (i.e. `output.nq.gz`) and done in a background thread, see
+    `quadipy.compression.open_compressed`.
+
+    Examples:
+        with NQuadsFileSink("output.nq") as sink:
+            for record in records:
+                sink.add(config.quadify(record))
+
+    Attributes:
+        path: The path of the N-Quads file
+        position: When given, the file is opened in place and truncated to this byte position instead of being
+            overwritten. This is used to resume writing from a checkpoint, dropping anything written after it.
+            Only supported for uncompressed files that are at least `position` bytes long
+        compression: A `Compression`, `None` for an uncompressed file, or `infer` to infer it from the file extension
+    """
+
+    def __init__(
+        self,
+        path: str,
+        position: Optional[int] = None,
+        compression: Union[Compression, str, None] = "infer",
+    ) -> None:
+        self.path = path
+        self.compression = (
+            Compression.infer(path) if compression == "infer" else compression
+        )
+        self.stats = SinkStats()
+        self._started_at = time.perf_counter()
+        if self.compression:
+            if position is not None:
+                raise ValueError(f"Can't resume writing compressed file {path}")
+            self._file: IO = open_compressed(path, "wb", self.compression)
+        elif position is None:
+            self._file = open(path, "wb")
+        else:
+            # Resuming a file that lost data would silently drop everything written before `position`
+            if not os.path.exists(path):
+                raise ValueError(f"Can't resume writing {path}, the file doesn't exist")
+            if os.path.getsize(path) < position:
+                raise ValueError(
+                    f"Can't resume writing {path} at byte {position}, the file is shorter"
+                )
+            self._file = open(path, "r+b")
+            self._file.truncate(position)
+            self._file.seek(position)
+
+    def __enter__(self) -> "NQuadsFileSink":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @property
+    def position(self) -> int:
+        """The byte position in the file that the next quad will be written at
+
+        Raises:
+            ValueError: If the file is compressed, since writes can't be resumed at a position of a compressed file
+        """
+        if self.compression:
+            raise ValueError(
+                f"{self.path} is compressed, it has no position to resume at"
+            )
+        return self._file.tell()
+
+    def add(self, quads: Iterable[Quad]) -> None:
+        count = 0
+        for quad in quads:
+            self._file.write(quad.to_nquad().encode("utf-8"))
+            count += 1
+        self.stats.quads += count
+
+    def flush(self) -> SinkStats:
+        """Flushes buffered quads, syncing them to disk so they survive a crash when the file isn't compressed"""
+        self._file.flush()
+        if not self.compression:
+            os.fsync(self._file.fileno())
+        self.stats.batches += 1
+        self.stats.seconds = time.perf_counter() - self._started_at
+        return self.stats
+
+    def close(self) -> SinkStats:
+        if self._file.closed:
+            return self.stats
+        try:
+            return self.flush()
+        finally:
+            self._file.close()
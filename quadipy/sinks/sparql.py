@@ -0,0 +1,251 @@
+import http.client
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import quote, urlsplit
+
+from rdflib import URIRef
+
+from quadipy.schemas.quad import Quad
+from quadipy.sinks.stats import SinkStats
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Raised when sending on a keep-alive connection that the server already closed
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionError)
+
+
+class SparqlProtocol(Enum):
+    """How batches are sent to the triple store
+
+    update: `INSERT DATA` requests following the SPARQL 1.1 Update protocol
+    graph_store: N-Triples `POST`s following the SPARQL 1.1 Graph Store HTTP Protocol
+    """
+
+    update = "update"
+    graph_store = "graph_store"
+
+
+class SparqlSinkError(RuntimeError):
+    """Raised when a batch couldn't be written after exhausting all retries"""
+
+
+class _ConnectionPool:
+    """A fixed size pool of keep-alive connections to a single host"""
+
+    def __init__(self, url: str, size: int, timeout: float) -> None:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"{url} must be an http or https url")
+        self.scheme = parts.scheme
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port
+        self.timeout = timeout
+        self._pool: "queue.LifoQueue[Optional[http.client.HTTPConnection]]" = (
+            queue.LifoQueue()
+        )
+        for _ in range(size):
+            self._pool.put(None)
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.timeout
+            )
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def request(
+        self, method: str, path: str, body: bytes, headers: Dict[str, str]
+    ) -> int:
+        """Sends a request on a pooled connection and returns the response status
+
+        Connections are created lazily and dropped from the pool when a request fails on them. Triple stores close
+        idle keep-alive connections, so a request that fails because its pooled connection was closed is sent
+        again right away on a new connection, without counting as a retry.
+        """
+        conn = self._pool.get()
+        reused = conn is not None
+        while True:
+            conn = conn or self._new_connection()
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                break
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    self._pool.put(None)
+                    raise
+                conn = None
+                reused = False
+            except Exception:
+                conn.close()
+                self._pool.put(None)
+                raise
+        if response.will_close:
+            conn.close()
+            self._pool.put(None)
+        else:
+            self._pool.put(conn)
+        return response.status
+
+    def close(self) -> None:
+        while not self._pool.empty():
+            conn = self._pool.get_nowait()
+            if conn:
+                conn.close()
+
+
+class SparqlSink:
+    """Writes quads to a triple store over HTTP
+
+    Quads are batched per named graph and each batch is sent as a single request, either as an
+    `INSERT DATA` update or as a Graph Store Protocol `POST`. Requests are sent on a pool of
+    keep-alive connections by `concurrency` worker threads and retried with exponential backoff.
+
+    Examples:
+        with SparqlSink("http://localhost:3030/ds/update") as sink:
+            for record in records:
+                sink.add(config.quadify(record))
+        print(sink.stats.quads_per_second)
+
+    Attributes:
+        endpoint: The SPARQL Update or Graph Store endpoint url
+        protocol: The protocol used to send batches, see `SparqlProtocol`
+        batch_size: Max number of quads sent in a single request
+        concurrency: Number of requests in flight (and pooled connections)
+        max_retries: Number of times a failed request is retried before giving up
+        backoff: Seconds to wait before the first retry, doubled on every subsequent retry
+        timeout: Socket timeout in seconds of each request
+        headers: Extra headers sent with every request, i.e. `Authorization`
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        protocol: SparqlProtocol = SparqlProtocol.update,
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 30.0,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        if batch_size < 1 or concurrency < 1:
+            raise ValueError("batch_size and concurrency must be at least 1")
+        self.endpoint = endpoint
+        self.protocol = SparqlProtocol(protocol)
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.headers = headers or {}
+        self.stats = SinkStats()
+        parts = urlsplit(endpoint)
+        self._path = parts.path or "/"
+        self._query = parts.query
+        self._pool = _ConnectionPool(endpoint, concurrency, timeout)
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+        self._in_flight: Set[Future] = set()
+        self._batches: Dict[Optional[URIRef], List[Quad]] = {}
+        self._lock = threading.Lock()
+        self._started_at: Optional[float] = None
+
+    def __enter__(self) -> "SparqlSink":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def add(self, quads: Iterable[Quad]) -> None:
+        """Buffers quads and sends every batch that reaches `batch_size`"""
+        if self._started_at is None:
+            self._started_at = time.perf_counter()
+        for quad in quads:
+            batch = self._batches.setdefault(quad.graph, [])
+            batch.append(quad)
+            if len(batch) >= self.batch_size:
+                self._submit(quad.graph, self._batches.pop(quad.graph))
+
+    def flush(self) -> SinkStats:
+        """Sends all buffered quads and waits for every request in flight to finish
+
+        Raises:
+            SparqlSinkError: If a batch failed after `max_retries` retries
+        """
+        for graph in list(self._batches):
+            self._submit(graph, self._batches.pop(graph))
+        self._wait(len(self._in_flight))
+        if self._started_at is not None:
+            self.stats.seconds = time.perf_counter() - self._started_at
+        return self.stats
+
+    def close(self) -> SinkStats:
+        try:
+            return self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+            self._pool.close()
+
+    def _submit(self, graph: Optional[URIRef], quads: List[Quad]) -> None:
+        # Bound the number of pending batches so a fast producer can't buffer the whole input
+        if len(self._in_flight) >= 2 * self.concurrency:
+            self._wait(len(self._in_flight) - 2 * self.concurrency + 1)
+        self._in_flight.add(self._executor.submit(self._send, graph, quads))
+
+    def _wait(self, count: int) -> None:
+        while count > 0 and self._in_flight:
+            done, self._in_flight = wait(self._in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+            count -= len(done)
+
+    def _request(
+        self, graph: Optional[URIRef], quads: List[Quad]
+    ) -> Tuple[str, str, str]:
+        if self.protocol == SparqlProtocol.graph_store:
+            target = f"graph={quote(str(graph), safe='')}" if graph else "default"
+            query = f"{self._query}&{target}" if self._query else target
+            body = "".join(quad.to_ntriple() for quad in quads)
+            content_type = "application/n-triples"
+            return f"{self._path}?{query}", body, content_type
+        triples = "".join(quad.to_ntriple() for quad in quads)
+        if graph:
+            triples = f"GRAPH {graph.n3()} {{\n{triples}}}\n"
+        body = f"INSERT DATA {{\n{triples}}}\n"
+        path = f"{self._path}?{self._query}" if self._query else self._path
+        return path, body, "application/sparql-update"
+
+    def _send(self, graph: Optional[URIRef], quads: List[Quad]) -> None:
+        path, body, content_type = self._request(graph, quads)
+        headers = {"Content-Type": f"{content_type}; charset=utf-8", **self.headers}
+        payload = body.encode("utf-8")
+        error = ""
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                with self._lock:
+                    self.stats.retries += 1
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                status = self._pool.request("POST", path, payload, headers)
+            except (OSError, http.client.HTTPException) as exc:
+                logging.info(f"Request to {self.endpoint} failed: {exc}")
+                error = f"{exc}"
+                continue
+            if status < 300:
+                with self._lock:
+                    self.stats.quads += len(quads)
+                    self.stats.batches += 1
+                return
+            error = f"HTTP {status}"
+            if status not in RETRYABLE_STATUS_CODES:
+                break
+            logging.info(f"Request to {self.endpoint} failed with {error}")
+        raise SparqlSinkError(
+            f"Failed to write {len(quads)} quads to {self.endpoint}: {error}"
+        )
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+
+
+class SinkStats(BaseModel):
+    """Throughput report of a sink
+
+    Attributes:
+        quads: Number of quads successfully written
+        batches: Number of batches successfully written (HTTP requests or file flushes)
+        retries: Number of requests that had to be retried
+        seconds: Wall time spent writing
+    """
+
+    quads: int = 0
+    batches: int = 0
+    retries: int = 0
+    seconds: float = 0.0
+
+    @property
+    def quads_per_second(self) -> float:
+        if not self.seconds:
+            return 0.0
+        return self.quads / self.seconds
@@ -0,0 +1,139 @@
+import heapq
+import os
+import tempfile
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from quadipy.compression import open_compressed
+from quadipy.schemas.quad import Quad
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+DEFAULT_FAN_IN = 128
+
+# Rough per quad overhead of the tuple and two str objects held in memory, on top of the characters themselves
+_ITEM_OVERHEAD = 160
+
+Row = Tuple[str, str]
+
+
+def _sort_key(quad: Quad) -> Row:
+    # Ordering by the serialized line orders by subject, then predicate, then object, since the N-Triples form of
+    # a subject or predicate never contains a space. The graph goes first so each graph's quads are contiguous
+    graph = quad.graph.n3() if quad.graph else ""
+    return graph, quad.to_nquad()
+
+
+def _write_run(rows: Iterable[Row], tmp_dir: str) -> str:
+    fd, path = tempfile.mkstemp(suffix=".run", dir=tmp_dir)
+    with open(fd, "w", encoding="utf-8", newline="\n") as f:
+        for graph, line in rows:
+            f.write(f"{graph} {line}")
+    return path
+
+
+def _read_run(path: str) -> Iterator[Row]:
+    with open(path, encoding="utf-8", newline="\n") as f:
+        for run_line in f:
+            graph, line = run_line.split(" ", 1)
+            yield graph, line
+
+
+def _unique(rows: Iterable[Row]) -> Iterator[Row]:
+    previous = None
+    for row in rows:
+        if row != previous:
+            yield row
+            previous = row
+
+
+def _merge_runs(paths: List[str], tmp_dir: str, fan_in: int) -> List[str]:
+    """Merges runs in passes of `fan_in` runs until at most `fan_in - 1` are left, to bound the open files
+
+    One slot is kept free for the quads still held in memory, which are merged with the last runs
+    """
+    while len(paths) >= fan_in:
+        merged = []
+        for i in range(0, len(paths), fan_in):
+            group = paths[i : i + fan_in]
+            merged.append(
+                _write_run(
+                    _unique(heapq.merge(*(_read_run(path) for path in group))),
+                    tmp_dir,
+                )
+            )
+            for path in group:
+                os.remove(path)
+        paths = merged
+    return paths
+
+
+def sort_quads(
+    quads: Iterable[Quad],
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    tmp_dir: Optional[str] = None,
+    fan_in: int = DEFAULT_FAN_IN,
+) -> Iterator[str]:
+    """Sorts and exactly deduplicates a stream of quads that can be larger than memory
+
+    Quads are buffered until they reach `memory_budget`, then sorted, deduplicated and spilled to a run file in
+    `tmp_dir`. Once the input is exhausted the runs are merged back into a single sorted stream. Quads are
+    ordered by graph, then subject, predicate and object, so all quads of a graph and subject are contiguous.
+
+    Examples:
+        quads = (quad for record in records for quad in config.quadify(record))
+        for line in sort_quads(quads, memory_budget=512 * 1024 * 1024):
+            ...
+
+    Args:
+        quads: The quads to sort, i.e. the output of `GraphFormatConfig.quadify`
+        memory_budget: Approximate number of bytes of quads buffered in memory before spilling a run to disk
+        tmp_dir: The directory the run files are written to, defaults to the system's temp directory
+        fan_in: Max number of runs merged at once
+
+    Returns:
+        An iterator over the unique N-Quads lines in sorted order
+
+    Raises:
+        ValueError: If `fan_in` is lower than 2
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    with tempfile.TemporaryDirectory(prefix="quadipy-sort-", dir=tmp_dir) as run_dir:
+        runs: List[str] = []
+        rows: List[Row] = []
+        size = 0
+        for quad in quads:
+            row = _sort_key(quad)
+            rows.append(row)
+            size += len(row[0]) + len(row[1]) + _ITEM_OVERHEAD
+            if size >= memory_budget:
+                rows.sort()
+                runs.append(_write_run(_unique(rows), run_dir))
+                rows = []
+                size = 0
+        rows.sort()
+        runs = _merge_runs(runs, run_dir, fan_in)
+        merged = heapq.merge(*(_read_run(path) for path in runs), iter(rows))
+        for _, line in _unique(merged):
+            yield line
+
+
+def write_sorted_nquads(
+    quads: Iterable[Quad],
+    path: str,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    tmp_dir: Optional[str] = None,
+    fan_in: int = DEFAULT_FAN_IN,
+) -> int:
+    """Writes quads to a sorted and exactly deduplicated N-Quads file, see `sort_quads`
+
+    The output is compressed if its extension is a compressed one, i.e. `output.nq.gz`
+
+    Returns:
+        The number of unique quads written
+    """
+    count = 0
+    with open_compressed(path, "wt") as f:
+        for line in sort_quads(quads, memory_budget, tmp_dir, fan_in):
+            f.write(line)
+            count += 1
+    return count
@@ -0,0 +1,61 @@
+import csv
+import json
+import os
+from typing import Any, Dict, Iterator, Union
+
+from quadipy.compression import Compression, open_compressed
+
+
+def read_jsonl(
+    path: str, compression: Union[Compression, str, None] = "infer"
+) -> Iterator[Dict]:
+    """Reads records from a JSON lines file, one JSON object per line
+
+    Args:
+        path: The path of the file, which can be compressed (i.e. `records.jsonl.gz`)
+        compression: See `quadipy.compression.open_compressed`
+
+    Returns:
+        An iterator over the records of the file
+    """
+    with open_compressed(path, "rt", compression) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_csv(
+    path: str, compression: Union[Compression, str, None] = "infer", **kwargs: Any
+) -> Iterator[Dict]:
+    """Reads records from a CSV file with a header row
+
+    Args:
+        path: The path of the file, which can be compressed (i.e. `records.csv.zst`)
+        compression: See `quadipy.compression.open_compressed`
+        kwargs: Passed through to `csv.DictReader`, i.e. `delimiter`
+
+    Returns:
+        An iterator over the records of the file
+    """
+    with open_compressed(path, "rt", compression, newline="") as f:
+        yield from csv.DictReader(f, **kwargs)
+
+
+def read_records(path: str) -> Iterator[Dict]:
+    """Reads records from a CSV or JSON lines file, inferring the format and compression from the extension
+
+    Examples:
+        records.csv, records.jsonl, records.ndjson.gz, records.csv.zst
+
+    Raises:
+        ValueError: If the file format can't be inferred from the extension
+    """
+    name = path
+    if Compression.infer(path):
+        name = os.path.splitext(path)[0]
+    extension = os.path.splitext(name)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        return read_jsonl(path)
+    if extension in (".csv", ".tsv"):
+        return read_csv(path, delimiter="\t" if extension == ".tsv" else ",")
+    raise ValueError(f"Can't infer the format of {path}, expected csv or jsonl")
@@ -0,0 +1,104 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from rdflib import URIRef
+from rdflib.store import Store
+
+from quadipy.schemas.graph_format_config import GraphFormatConfig
+
+
+class QuadifyStore(Store):
+    """Read-only rdflib Store that quadifies source records on demand
+
+    Instead of loading every quad of a source into a `Graph`, this store keeps the source records indexed by
+    subject and the `predicate_mapping` indexed by predicate URI. A triple pattern then only quadifies the records
+    and columns that can match it, i.e. querying a known subject costs one index lookup. Named graphs aren't
+    exposed, every quad is served from the store's single graph. Like a `Graph`, the store holds each triple once,
+    even when several records or columns of a subject produce it.
+
+    Examples:
+        graph = Graph(store=QuadifyStore(config, records))
+        graph.query("SELECT ?name WHERE { <1> <https://schema.org/name> ?name }")
+
+    Attributes:
+        config: The config used to quadify the records
+        records: The source records, indexed the first time the store is queried
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(self, config: GraphFormatConfig, records: Iterable[Dict]) -> None:
+        super().__init__()
+        self.config = config
+        self.records = records
+        self._subjects: Optional[Dict[URIRef, List[Dict]]] = None
+        self._predicates: Dict[URIRef, List[str]] = {}
+        for col_name, mapping in config.predicate_mapping.items():
+            self._predicates.setdefault(mapping.predicate_uri, []).append(col_name)
+        self._namespaces: Dict[str, URIRef] = {}
+
+    @property
+    def subjects(self) -> Dict[URIRef, List[Dict]]:
+        """Index from subject URI to the records with that `primary_key`"""
+        if self._subjects is None:
+            subjects: Dict[URIRef, List[Dict]] = {}
+            for record in self.records:
+                subjects.setdefault(self.config.subject(record), []).append(record)
+            self._subjects = subjects
+        return self._subjects
+
+    def triples(
+        self, triple_pattern: Tuple, context: Optional[Any] = None
+    ) -> Iterator[Tuple[Tuple, Iterator]]:
+        subject, predicate, obj = triple_pattern
+        if predicate is None:
+            col_names: List[str] = list(self.config.predicate_mapping)
+        else:
+            col_names = self._predicates.get(predicate, [])
+        if not col_names:
+            return
+        if subject is None:
+            groups: Iterable[List[Dict]] = self.subjects.values()
+        else:
+            groups = [self.subjects.get(subject, [])]
+        for records in groups:
+            # Triples of different subjects never collide, so deduplicating per subject is exact and only holds
+            # one subject's triples in memory
+            seen: Set[Tuple] = set()
+            for record in records:
+                for col_name in col_names:
+                    for quad in self.config.quadify_column(record, col_name):
+                        triple = (quad.subject, quad.predicate, quad.obj)
+                        if (obj is None or quad.obj == obj) and triple not in seen:
+                            seen.add(triple)
+                            yield triple, iter(())
+
+    def __len__(self, context: Optional[Any] = None) -> int:
+        return sum(1 for _ in self.triples((None, None, None)))
+
+    def add(self, triple: Tuple, context: Any, quoted: bool = False) -> None:
+        raise TypeError("The QuadifyStore is read only")
+
+    def addN(self, quads: Iterable[Tuple]) -> None:  # noqa: N802
+        raise TypeError("The QuadifyStore is read only")
+
+    def remove(self, triple: Tuple, context: Optional[Any] = None) -> None:
+        raise TypeError("The QuadifyStore is read only")
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        if override or prefix not in self._namespaces:
+            self._namespaces[prefix] = namespace
+
+    def namespace(self, prefix: str) -> Optional[URIRef]:
+        return self._namespaces.get(prefix)
+
+    def prefix(self, namespace: URIRef) -> Optional[str]:
+        for prefix, bound in self._namespaces.items():
+            if bound == namespace:
+                return prefix
+        return None
+
+    def namespaces(self) -> Iterator[Tuple[str, URIRef]]:
+        yield from self._namespaces.items()
@@ -0,0 +1,94 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+from rdflib import XSD, Literal
+
+from quadipy.schemas.converters import (
+    to_boolean,
+    to_date,
+    to_datetime,
+    to_decimal,
+    to_integer,
+)
+
+
+@pytest.mark.parametrize("value", [42, "42", " 42 ", 42.0, Decimal("42.0")])
+def test_to_integer(value):
+    assert to_integer(value) == Literal("42", datatype=XSD.integer)
+
+
+@pytest.mark.parametrize(
+    "value", [True, 4.2, Decimal("1.5"), Decimal("NaN"), "4.2", "forty two", None]
+)
+def test_to_integer_invalid(value):
+    with pytest.raises((ValueError, TypeError)):
+        to_integer(value)
+
+
+@pytest.mark.parametrize("value", ["1.50", Decimal("1.50"), " 1.50"])
+def test_to_decimal(value):
+    assert to_decimal(value) == Literal("1.50", datatype=XSD.decimal)
+
+
+def test_to_decimal_float():
+    assert to_decimal(0.1) == Literal("0.1", datatype=XSD.decimal)
+
+
+@pytest.mark.parametrize("value", [False, "NaN", "inf", "one", None])
+def test_to_decimal_invalid(value):
+    with pytest.raises((ValueError, TypeError, ArithmeticError)):
+        to_decimal(value)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (True, True),
+        (0, False),
+        ("TRUE", True),
+        ("false", False),
+        ("yes", True),
+        (" 0 ", False),
+    ],
+)
+def test_to_boolean(value, expected):
+    assert to_boolean(value) == Literal(expected)
+    assert to_boolean(value).datatype == XSD.boolean
+
+
+@pytest.mark.parametrize("value", [2, "maybe", None])
+def test_to_boolean_invalid(value):
+    with pytest.raises(ValueError):
+        to_boolean(value)
+
+
+@pytest.mark.parametrize(
+    "value", ["2022-01-01", " 2022-01-01 ", date(2022, 1, 1), datetime(2022, 1, 1, 12)]
+)
+def test_to_date(value):
+    assert to_date(value) == Literal("2022-01-01", datatype=XSD.date)
+
+
+@pytest.mark.parametrize("value", ["tall", "2022-13-01", 20220101, None])
+def test_to_date_invalid(value):
+    with pytest.raises((ValueError, TypeError)):
+        to_date(value)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("2022-01-01T12:30:00", datetime(2022, 1, 1, 12, 30)),
+        ("2022-01-01T12:30:00Z", datetime(2022, 1, 1, 12, 30, tzinfo=timezone.utc)),
+        (datetime(2022, 1, 1, 12, 30), datetime(2022, 1, 1, 12, 30)),
+    ],
+)
+def test_to_datetime(value, expected):
+    assert to_datetime(value) == Literal(expected, datatype=XSD.dateTime)
+
+
+@pytest.mark.parametrize("value", [date(2022, 1, 1), "yesterday", 1640995200])
+def test_to_datetime_invalid(value):
+    with pytest.raises((ValueError, TypeError)):
+        to_datetime(value)
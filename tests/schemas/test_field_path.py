@@ -0,0 +1,68 @@
+import pickle
+
+import pytest
+
+from quadipy.schemas.field_path import MISSING, compile_accessor, parse_field_path
+
+RECORD = {
+    "id": 1,
+    "tags": "urgent",
+    "company": {"name": "Rebel Alliance", "address": {"city": "Yavin 4"}},
+    "founders": [{"name": "Mon Mothma"}, {"name": "Bail Organa"}],
+    "attributes": {"first.name": "Leia"},
+    "flat.key": "flat",
+}
+
+
+@pytest.mark.parametrize(
+    "path,steps",
+    [
+        ("id", ["id"]),
+        ("company.address.city", ["company", "address", "city"]),
+        ("$.founders[0].name", ["founders", 0, "name"]),
+        ("founders[-1]", ["founders", -1]),
+        ("attributes['first.name']", ["attributes", "first.name"]),
+    ],
+)
+def test_parse_field_path(path, steps):
+    assert parse_field_path(path) == steps
+
+
+@pytest.mark.parametrize("path", ["", "$", ".id", "company.", "company..name", "a[x]"])
+def test_parse_invalid_field_path(path):
+    with pytest.raises(ValueError):
+        parse_field_path(path)
+
+
+@pytest.mark.parametrize(
+    "path,value",
+    [
+        ("id", 1),
+        ("company.address.city", "Yavin 4"),
+        ("$.founders[1].name", "Bail Organa"),
+        ('attributes["first.name"]', "Leia"),
+        ("flat.key", "flat"),
+    ],
+)
+def test_compile_accessor(path, value):
+    assert compile_accessor(path)(RECORD) == value
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["missing", "company.missing", "founders[5].name", "id.nested", "tags[0]"],
+)
+def test_compile_accessor_missing(path):
+    assert compile_accessor(path)(RECORD) is None
+    assert compile_accessor(path, MISSING)(RECORD) is MISSING
+
+
+@pytest.mark.parametrize("path", ["Revenue [USD]", "tags[]", "a..b", "x."])
+def test_compile_accessor_plain_key(path):
+    assert compile_accessor(path)({path: 1}) == 1
+
+
+def test_pickle_accessor():
+    accessor = pickle.loads(pickle.dumps(compile_accessor("company.name", MISSING)))
+    assert accessor(RECORD) == "Rebel Alliance"
+    assert accessor({}) is MISSING
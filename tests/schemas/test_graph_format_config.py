@@ -1,6 +1,8 @@
+import pickle
 from datetime import date, datetime
 
 import pytest
+from pydantic import ValidationError
 from rdflib import RDF, XSD, Literal, Namespace, URIRef
 
 from quadipy.schemas.graph_format_config import GraphFormatConfig
@@ -347,3 +349,148 @@ def test_bad_list_process_quad_list():
     ]
     quads_empty_list = config.process_quad_list("[]", predicate_uri, record_empty_list)
     assert quads_empty_list == []
+
+
+def test_process_quad_list_converts_items():
+    integer_config = GraphFormatConfig(
+        primary_key="id",
+        source_name="star wars",
+        predicate_mapping={
+            "episodes": {
+                "predicate_uri": "https://starwarsdb.org/episode",
+                "obj_datatype": "integer",
+            }
+        },
+    )
+    record = {"id": 1, "episodes": '["1", "x"]'}
+    assert [quad.obj for quad in integer_config.quadify(record)] == [
+        Literal(1, datatype=XSD.integer)
+    ]
+    quads = integer_config.process_quad_list(
+        "[4, 5]", URIRef("https://starwarsdb.org/episode"), record
+    )
+    assert [quad.obj for quad in quads] == [
+        Literal(4, datatype=XSD.integer),
+        Literal(5, datatype=XSD.integer),
+    ]
+    assert integer_config.quadify({"id": 1, "episodes": "[x"}) == []
+    with pytest.raises(KeyError):
+        integer_config.process_quad_list(
+            "[4]", URIRef("https://schema.org/name"), record
+        )
+
+
+def test_quadify_nested_record():
+    nested_config = GraphFormatConfig(
+        primary_key="organization.id",
+        date_field="meta.created_at",
+        source_name="star wars",
+        predicate_mapping={
+            "organization.name": {"predicate_uri": "https://schema.org/name"},
+            "founders[0].name": {"predicate_uri": "https://schema.org/founder"},
+        },
+    )
+    record = {
+        "organization": {"id": 1, "name": "Rebel Alliance"},
+        "founders": [{"name": "Mon Mothma"}],
+        "meta": {"created_at": "2022-01-01"},
+    }
+    quads = nested_config.quadify(record)
+    assert [quad.to_tuple() for quad in quads] == [
+        (
+            URIRef("1"),
+            URIRef("https://schema.org/name"),
+            Literal("Rebel Alliance"),
+            URIRef("2022-01-01"),
+        ),
+        (
+            URIRef("1"),
+            URIRef("https://schema.org/founder"),
+            Literal("Mon Mothma"),
+            URIRef("2022-01-01"),
+        ),
+    ]
+
+
+def test_nested_primary_key_missing():
+    nested_config = GraphFormatConfig(
+        primary_key="organization.id", **config.dict(exclude={"primary_key"})
+    )
+    with pytest.raises(AssertionError):
+        nested_config.subject({"organization": {"name": "Rebel Alliance"}})
+
+
+@pytest.mark.parametrize("col_name", ["Revenue [USD]", "tags[]", "a..b", "x."])
+def test_invalid_field_path_read_as_key(col_name):
+    plain_config = GraphFormatConfig(
+        primary_key="id",
+        source_name="star wars",
+        predicate_mapping={col_name: {"predicate_uri": "https://schema.org/name"}},
+    )
+    quads = plain_config.quadify({"id": 1, col_name: "Rebel Alliance"})
+    assert [quad.obj for quad in quads] == [Literal("Rebel Alliance")]
+
+
+def test_pickle():
+    record = {"id": 1, "url": "https://swapi.dev/"}
+    unpickled = pickle.loads(pickle.dumps(config))
+    assert unpickled.quadify(record) == config.quadify(record)
+    with pytest.raises(AssertionError):
+        unpickled.subject({"name": "Luke"})
+
+
+def test_copy_compiles_accessors():
+    copied = config.copy(
+        update={
+            "predicate_mapping": {
+                "a": PredicateMapping(predicate_uri="https://schema.org/name")
+            }
+        }
+    )
+    assert [quad.obj for quad in copied.quadify({"id": 1, "a": "Luke"})] == [
+        Literal("Luke")
+    ]
+    constructed = GraphFormatConfig.construct(**dict(config))
+    record = {"id": 1, "url": "https://swapi.dev/"}
+    assert constructed.quadify(record) == config.quadify(record)
+
+
+def test_quadify_python_list():
+    record = {"id": 1, "url": ["https://swapi.dev/", "https://starwars.com/"]}
+    quads = config.quadify(record)
+    assert [quad.obj for quad in quads] == [
+        URIRef("https://swapi.dev/"),
+        URIRef("https://starwars.com/"),
+    ]
+
+
+def test_quadify_column():
+    record = {"id": 1, "organization_name": "Rebel Alliance", "industry": '["Biotech"]'}
+    quads = config.quadify_column(record, "industry")
+    assert [quad.obj for quad in quads] == [Literal("Biotech")]
+
+
+def test_quadify_typed_values():
+    typed_config = GraphFormatConfig(
+        primary_key="id",
+        source_name="star wars",
+        predicate_mapping={
+            "height": {
+                "predicate_uri": "https://schema.org/height",
+                "obj_datatype": "integer",
+            },
+            "is_jedi": {
+                "predicate_uri": "https://starwarsdb.org/isJedi",
+                "obj_datatype": "boolean",
+            },
+            "name": {"predicate_uri": "https://schema.org/name", "obj_language": "en"},
+        },
+    )
+    record = {"id": 1, "height": "tall", "is_jedi": "false", "name": "Luke"}
+    quads = typed_config.quadify(record)
+    assert [quad.obj for quad in quads] == [Literal(False), Literal("Luke", lang="en")]
+
+
+def test_quadify_empty_string():
+    record = {"id": 1, "organization_name": ""}
+    assert config.quadify(record) == []
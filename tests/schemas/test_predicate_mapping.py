@@ -1,6 +1,8 @@
+import pickle
+
 import pytest
 from pydantic import ValidationError
-from rdflib import Namespace, URIRef
+from rdflib import XSD, Literal, Namespace, URIRef
 
 from quadipy.schemas.predicate_mapping import ObjectDataTypes, PredicateMapping
 
@@ -36,3 +38,114 @@ def test_obj_namespace():
         predicate_uri="https://schema.org/name", obj_namespace="wikipedia/"
     )
     assert mapping.obj_namespace == Namespace("wikipedia/")
+
+
+@pytest.mark.parametrize(
+    "obj_datatype,value,expected",
+    [
+        ("integer", "42", Literal("42", datatype=XSD.integer)),
+        ("decimal", "4.20", Literal("4.20", datatype=XSD.decimal)),
+        ("boolean", "false", Literal(False)),
+        (
+            "datetime",
+            "2022-01-01T00:00:00",
+            Literal("2022-01-01T00:00:00", datatype=XSD.dateTime),
+        ),
+        ("date", "2022-01-01", Literal("2022-01-01", datatype=XSD.date)),
+        ("uri", "https://swapi.dev/", URIRef("https://swapi.dev/")),
+    ],
+)
+def test_convert(obj_datatype, value, expected):
+    mapping = PredicateMapping(
+        predicate_uri="https://schema.org/name", obj_datatype=obj_datatype
+    )
+    assert mapping.convert(value) == expected
+
+
+@pytest.mark.parametrize("obj_datatype", ["integer", "date"])
+def test_convert_invalid(obj_datatype):
+    mapping = PredicateMapping(
+        predicate_uri="https://schema.org/height", obj_datatype=obj_datatype
+    )
+    assert mapping.convert("tall") is None
+    assert mapping.convert(None) is None
+
+
+def test_convert_with_namespace():
+    mapping = PredicateMapping(
+        predicate_uri="https://starwarsdb.org/planet",
+        obj_datatype="uri",
+        obj_namespace="starwars_planet",
+    )
+    assert mapping.convert("tatooine") == URIRef("starwars_planet/tatooine")
+
+
+def test_convert_language():
+    mapping = PredicateMapping(
+        predicate_uri="https://schema.org/name", obj_language="en"
+    )
+    assert mapping.convert("Luke Skywalker") == Literal("Luke Skywalker", lang="en")
+
+
+def test_invalid_language():
+    with pytest.raises(ValidationError):
+        PredicateMapping(
+            predicate_uri="https://schema.org/name", obj_language="not a tag"
+        )
+
+
+def test_language_requires_literal():
+    with pytest.raises(ValidationError):
+        PredicateMapping(
+            predicate_uri="https://schema.org/name",
+            obj_datatype="integer",
+            obj_language="en",
+        )
+
+
+def test_language_with_namespace():
+    with pytest.raises(ValidationError):
+        PredicateMapping(
+            predicate_uri="https://schema.org/name",
+            obj_namespace="starwars_planet",
+            obj_language="en",
+        )
+
+
+def test_pickle():
+    mapping = PredicateMapping(
+        predicate_uri="https://starwarsdb.org/planet",
+        obj_datatype="uri",
+        obj_namespace="starwars_planet",
+    )
+    assert pickle.loads(pickle.dumps(mapping)).convert("tatooine") == URIRef(
+        "starwars_planet/tatooine"
+    )
+
+
+def test_copy_builds_converter():
+    mapping = PredicateMapping(
+        predicate_uri="https://schema.org/height", obj_datatype="integer"
+    )
+    copied = mapping.copy(update={"obj_datatype": "boolean"})
+    assert copied.convert("true") == Literal(True)
+    assert copied.convert("tall") is None
+    constructed = PredicateMapping.construct(
+        predicate_uri=URIRef("https://schema.org/height"),
+        obj_datatype=ObjectDataTypes.integer,
+        obj_namespace=None,
+        obj_language=None,
+    )
+    assert constructed.convert("42") == Literal(42)
+
+
+def test_convert_many():
+    mapping = PredicateMapping(
+        predicate_uri="https://schema.org/height", obj_datatype="integer"
+    )
+    assert mapping.convert_many(["172", None, "tall", 96]) == [
+        Literal(172),
+        None,
+        None,
+        Literal(96),
+    ]
@@ -56,3 +56,24 @@ def test_to_tuple_without_graph():
     quad = Quad.from_tuple(tup)
     assert quad.to_tuple() == tup
     assert len(quad.to_tuple()) == 3
+
+
+def test_to_ntriple():
+    tup = (URIRef("foo"), URIRef("pred"), Literal('say "bar"'), URIRef("graph"))
+    quad = Quad.from_tuple(tup)
+    assert quad.to_ntriple() == '<foo> <pred> "say \\"bar\\"" .\n'
+
+
+def test_to_nquad_with_graph():
+    tup = (URIRef("foo"), URIRef("pred"), URIRef("bar"), URIRef("graph"))
+    quad = Quad.from_tuple(tup)
+    assert quad.to_nquad() == "<foo> <pred> <bar> <graph> .\n"
+
+
+def test_to_nquad_without_graph():
+    tup = (URIRef("foo"), URIRef("pred"), Literal(10))
+    quad = Quad.from_tuple(tup)
+    assert (
+        quad.to_nquad()
+        == '<foo> <pred> "10"^^<http://www.w3.org/2001/XMLSchema#integer> .\n'
+    )
@@ -0,0 +1,64 @@
+import gzip
+
+import pytest
+from rdflib import Literal, URIRef
+
+from quadipy.schemas.quad import Quad
+from quadipy.sinks.nquads import NQuadsFileSink
+
+QUAD = Quad(
+    subject=URIRef("luke"),
+    predicate=URIRef("https://schema.org/name"),
+    obj=Literal("Luke Skywalker"),
+    graph=URIRef("graph://star-wars"),
+)
+LINE = '<luke> <https://schema.org/name> "Luke Skywalker" <graph://star-wars> .\n'
+
+
+def test_write(tmp_path):
+    path = tmp_path / "output.nq"
+    with NQuadsFileSink(str(path)) as sink:
+        sink.add([QUAD, QUAD])
+    assert path.read_text() == LINE * 2
+    assert sink.stats.quads == 2
+
+
+def test_position(tmp_path):
+    with NQuadsFileSink(str(tmp_path / "output.nq")) as sink:
+        sink.add([QUAD])
+        assert sink.position == len(LINE.encode("utf-8"))
+
+
+def test_resume_from_position(tmp_path):
+    path = tmp_path / "output.nq"
+    path.write_text(LINE + "<partially written")
+    with NQuadsFileSink(str(path), position=len(LINE)) as sink:
+        sink.add([QUAD])
+    assert path.read_text() == LINE * 2
+
+
+def test_write_compressed(tmp_path):
+    path = tmp_path / "output.nq.gz"
+    with NQuadsFileSink(str(path)) as sink:
+        sink.add([QUAD, QUAD])
+        with pytest.raises(ValueError):
+            sink.position
+    assert gzip.decompress(path.read_bytes()).decode("utf-8") == LINE * 2
+
+
+def test_resume_compressed(tmp_path):
+    with pytest.raises(ValueError):
+        NQuadsFileSink(str(tmp_path / "output.nq.gz"), position=0)
+
+
+def test_resume_missing_file(tmp_path):
+    with pytest.raises(ValueError):
+        NQuadsFileSink(str(tmp_path / "output.nq"), position=len(LINE))
+
+
+def test_resume_file_shorter_than_position(tmp_path):
+    path = tmp_path / "output.nq"
+    path.write_text(LINE)
+    with pytest.raises(ValueError):
+        NQuadsFileSink(str(path), position=len(LINE) * 2)
+    assert path.read_text() == LINE
@@ -0,0 +1,152 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+from rdflib import Literal, URIRef
+
+from quadipy.schemas.quad import Quad
+from quadipy.sinks.sparql import SparqlProtocol, SparqlSink, SparqlSinkError
+
+QUADS = [
+    Quad(
+        subject=URIRef("luke"),
+        predicate=URIRef("https://schema.org/name"),
+        obj=Literal(f"Luke {i}"),
+        graph=URIRef("graph://star-wars") if i % 2 else None,
+    )
+    for i in range(10)
+]
+
+
+class StubTripleStore(ThreadingHTTPServer):
+    """Local stand-in for a triple store that records every request it receives"""
+
+    def __init__(
+        self, failures: int = 0, status: int = 503, keep_alive: bool = True
+    ) -> None:
+        self.requests = []
+        self.connections = set()
+        self.failures = failures
+        self.status = status
+        self.keep_alive = keep_alive
+        self.lock = threading.Lock()
+        super().__init__(("127.0.0.1", 0), StubHandler)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"])).decode("utf-8")
+        with self.server.lock:
+            self.server.connections.add(self.client_address)
+            fail = self.server.failures > 0
+            if fail:
+                self.server.failures -= 1
+            else:
+                self.server.requests.append((self.path, self.headers, body))
+        self.send_response(self.server.status if fail else 204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        # Drops the connection without announcing it, like a store closing an idle keep-alive connection
+        self.close_connection = not self.server.keep_alive
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def store_factory():
+    servers = []
+
+    def factory(**kwargs):
+        server = StubTripleStore(**kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield factory
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_insert_data_batched_by_graph(store_factory):
+    store = store_factory()
+    with SparqlSink(f"{store.url}/update", batch_size=2, concurrency=2) as sink:
+        sink.add(QUADS)
+    assert sink.stats.quads == 10
+    assert sink.stats.batches == 6
+    bodies = [body for _, _, body in store.requests]
+    assert all(body.startswith("INSERT DATA {") for body in bodies)
+    assert sum("GRAPH <graph://star-wars>" in body for body in bodies) == 3
+    assert all(
+        headers["Content-Type"].startswith("application/sparql-update")
+        for _, headers, _ in store.requests
+    )
+
+
+def test_connections_are_reused(store_factory):
+    store = store_factory()
+    with SparqlSink(store.url, batch_size=1, concurrency=1) as sink:
+        sink.add(QUADS)
+    assert len(store.requests) == 10
+    assert len(store.connections) == 1
+
+
+def test_stale_connections_are_replaced(store_factory):
+    store = store_factory(keep_alive=False)
+    with SparqlSink(store.url, batch_size=1, concurrency=1, max_retries=0) as sink:
+        sink.add(QUADS[:3])
+    assert len(store.requests) == 3
+    assert sink.stats.retries == 0
+
+
+def test_graph_store_protocol(store_factory):
+    store = store_factory()
+    with SparqlSink(
+        f"{store.url}/data", protocol=SparqlProtocol.graph_store, batch_size=100
+    ) as sink:
+        sink.add(QUADS)
+    targets = {}
+    for path, headers, body in store.requests:
+        assert headers["Content-Type"].startswith("application/n-triples")
+        targets[urlsplit(path).query] = body
+    assert set(targets) == {"default", "graph=graph%3A%2F%2Fstar-wars"}
+    assert targets["default"].count("\n") == 5
+
+
+def test_retries_with_backoff(store_factory):
+    store = store_factory(failures=2)
+    with SparqlSink(store.url, batch_size=100, backoff=0.01) as sink:
+        sink.add(QUADS[:1])
+    assert sink.stats.retries == 2
+    assert sink.stats.quads == 1
+    assert len(store.requests) == 1
+
+
+def test_gives_up_after_max_retries(store_factory):
+    store = store_factory(failures=10)
+    sink = SparqlSink(store.url, max_retries=1, backoff=0.01)
+    sink.add(QUADS)
+    with pytest.raises(SparqlSinkError):
+        sink.close()
+
+
+def test_client_errors_are_not_retried(store_factory):
+    store = store_factory(failures=1, status=400)
+    sink = SparqlSink(store.url, backoff=0.01)
+    sink.add(QUADS[:1])
+    with pytest.raises(SparqlSinkError):
+        sink.close()
+    assert sink.stats.retries == 0
+
+
+def test_invalid_endpoint():
+    with pytest.raises(ValueError):
+        SparqlSink("ftp://localhost/update")
@@ -0,0 +1,29 @@
+import json
+
+from click.testing import CliRunner
+
+from quadipy.cli import cli
+
+
+def test_validate():
+    result = CliRunner().invoke(cli, ["validate", "examples/simple.json"])
+    assert result.exit_code == 0
+    assert "examples/simple.json" in result.output
+
+
+def test_profile(tmp_path):
+    records = tmp_path / "records.jsonl"
+    records.write_text(
+        "\n".join(
+            json.dumps({"id": i, "city": "Mos Eisley", "url": "https://swapi.dev/"})
+            for i in range(10)
+        )
+    )
+    result = CliRunner().invoke(
+        cli,
+        ["profile", "examples/simple.json", str(records), "--total-records", "1000"],
+    )
+    assert result.exit_code == 0, result.output
+    assert "quads per record    2.00" in result.output
+    assert "projected for 1000 records" in result.output
+    assert "quads    2000" in result.output
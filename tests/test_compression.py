@@ -0,0 +1,109 @@
+import gzip
+
+import pytest
+
+from quadipy.compression import Compression, ThreadedDecompressor, open_compressed
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+requires_zstd = pytest.mark.skipif(
+    zstandard is None, reason="zstandard isn't installed, see the zstd extra"
+)
+DATA = b"".join(b"line %d of some compressible data\n" % i for i in range(50000))
+
+
+@pytest.fixture(params=["gzip", "bz2", "xz", pytest.param("zstd", marks=requires_zstd)])
+def compression(request):
+    return Compression(request.param)
+
+
+@pytest.mark.parametrize(
+    "path,compression",
+    [
+        ("records.jsonl.gz", Compression.gzip),
+        ("records.csv.BZ2", Compression.bz2),
+        ("output.nq.xz", Compression.xz),
+        ("output.nq.zst", Compression.zstd),
+        ("records.jsonl", None),
+    ],
+)
+def test_infer(path, compression):
+    assert Compression.infer(path) == compression
+
+
+def test_roundtrip_binary(tmp_path, compression):
+    path = str(tmp_path / "data")
+    with open_compressed(path, "wb", compression, buffer_chunks=2) as f:
+        for i in range(0, len(DATA), 1000):
+            f.write(DATA[i : i + 1000])
+    with open(path, "rb") as f:
+        assert len(f.read()) < len(DATA)
+    with open_compressed(path, "rb", compression, buffer_chunks=2) as f:
+        assert f.read() == DATA
+
+
+def test_roundtrip_text(tmp_path, compression):
+    path = str(tmp_path / "data")
+    with open_compressed(path, "wt", compression) as f:
+        f.write("café\nnaïve\n")
+    with open_compressed(path, "rt", compression) as f:
+        assert list(f) == ["café\n", "naïve\n"]
+
+
+def test_infer_from_extension(tmp_path):
+    path = str(tmp_path / "data.gz")
+    with open_compressed(path, "wb") as f:
+        f.write(DATA)
+    assert gzip.decompress(open(path, "rb").read()) == DATA
+
+
+def test_uncompressed(tmp_path):
+    path = str(tmp_path / "data.txt")
+    with open_compressed(path, "wb") as f:
+        f.write(DATA)
+    assert open(path, "rb").read() == DATA
+
+
+def test_concatenated_streams(tmp_path):
+    path = tmp_path / "data.gz"
+    path.write_bytes(gzip.compress(b"first\n") + gzip.compress(b"second\n"))
+    with open_compressed(str(path), "rt") as f:
+        assert f.read() == "first\nsecond\n"
+
+
+def test_truncated_stream(tmp_path):
+    path = tmp_path / "data.gz"
+    path.write_bytes(gzip.compress(DATA)[:-100])
+    with pytest.raises(EOFError):
+        with open_compressed(str(path), "rb") as f:
+            f.read()
+
+
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz"])
+def test_decompressed_chunks_are_bounded(tmp_path, compression):
+    path = str(tmp_path / "data")
+    data = b"0" * (1 << 22)
+    with open_compressed(path, "wb", compression=compression) as f:
+        f.write(data)
+    with ThreadedDecompressor(
+        open(path, "rb"), Compression(compression), chunk_size=1024
+    ) as f:
+        chunks = list(iter(lambda: f.read(1 << 22), b""))
+    assert b"".join(chunks) == data
+    assert max(len(chunk) for chunk in chunks) == 1024
+
+
+def test_close_before_end(tmp_path):
+    path = str(tmp_path / "data.gz")
+    with open_compressed(path, "wb") as f:
+        f.write(DATA)
+    with open_compressed(path, "rb", buffer_chunks=1) as f:
+        assert f.read(10) == DATA[:10]
+
+
+def test_invalid_mode(tmp_path):
+    with pytest.raises(ValueError):
+        open_compressed(str(tmp_path / "data.gz"), "ab")
@@ -0,0 +1,89 @@
+import pytest
+
+from quadipy.job import IngestionJob
+from quadipy.schemas.graph_format_config import GraphFormatConfig
+
+config = GraphFormatConfig(
+    primary_key="id",
+    source_name="star wars",
+    predicate_mapping={
+        "name": {"predicate_uri": "https://schema.org/name"},
+        "planet": {"predicate_uri": "https://starwarsdb.org/planet"},
+    },
+)
+RECORDS = [{"id": i, "name": f"Jedi {i}", "planet": "Tatooine"} for i in range(25)]
+
+
+class Crash(Exception):
+    pass
+
+
+def crash_after(records, count):
+    for i, record in enumerate(records):
+        if i == count:
+            raise Crash()
+        yield record
+
+
+@pytest.fixture
+def job(tmp_path):
+    return IngestionJob(
+        config,
+        str(tmp_path / "output.nq"),
+        str(tmp_path / "output.nq.checkpoint"),
+        checkpoint_every=10,
+    )
+
+
+def expected_output(tmp_path):
+    path = tmp_path / "expected.nq"
+    IngestionJob(config, str(path), str(tmp_path / "expected.checkpoint")).run(RECORDS)
+    return path.read_text()
+
+
+def test_run(job, tmp_path):
+    checkpoint = job.run(RECORDS)
+    assert checkpoint.offset == 25
+    assert checkpoint.quads_written == 50
+    assert checkpoint.completed
+    assert job.load_checkpoint() == checkpoint
+    assert (tmp_path / "output.nq").read_text().count("\n") == 50
+
+
+def test_resume_after_crash(job, tmp_path):
+    with pytest.raises(Crash):
+        job.run(crash_after(RECORDS, 17))
+    checkpoint = job.load_checkpoint()
+    assert checkpoint.offset == 10
+    assert not checkpoint.completed
+
+    checkpoint = job.run(RECORDS)
+    assert checkpoint.offset == 25
+    assert checkpoint.quads_written == 50
+    assert (tmp_path / "output.nq").read_text() == expected_output(tmp_path)
+
+
+def test_rerun_completed_job(job, tmp_path):
+    job.run(RECORDS)
+    checkpoint = job.run(RECORDS)
+    assert checkpoint.quads_written == 50
+    assert (tmp_path / "output.nq").read_text() == expected_output(tmp_path)
+
+
+def test_invalid_checkpoint_every(tmp_path):
+    with pytest.raises(ValueError):
+        IngestionJob(config, "output.nq", "checkpoint", checkpoint_every=0)
+
+
+def test_compressed_output(tmp_path):
+    with pytest.raises(ValueError):
+        IngestionJob(config, "output.nq.gz", "checkpoint")
+
+
+def test_resume_with_missing_output(job, tmp_path):
+    with pytest.raises(Crash):
+        job.run(crash_after(RECORDS, 17))
+    (tmp_path / "output.nq").unlink()
+    with pytest.raises(ValueError):
+        job.run(RECORDS)
+    assert job.load_checkpoint().offset == 10
@@ -0,0 +1,155 @@
+from datetime import date
+
+import pytest
+from rdflib import XSD, Literal, URIRef
+
+from quadipy.merge import merge_records, quadify_merged
+from quadipy.schemas.graph_format_config import GraphFormatConfig
+
+config = GraphFormatConfig(
+    primary_key="id",
+    source_name="star wars",
+    predicate_mapping={
+        "name": {"predicate_uri": "https://schema.org/name"},
+        "film": {"predicate_uri": "https://schema.org/film", "obj_datatype": "uri"},
+        "rank": {"predicate_uri": "https://starwarsdb.org/rank"},
+    },
+)
+RECORDS = [
+    {"id": 1, "name": "Luke Skywalker", "film": "https://swapi.dev/api/films/1/"},
+    {"id": 2, "name": "Leia Organa", "film": "https://swapi.dev/api/films/1/"},
+    {"id": 1, "name": "Luke Skywalker", "film": "https://swapi.dev/api/films/2/"},
+    {"id": 1, "name": "Luke Skywalker", "rank": "Commander"},
+]
+
+
+def test_merge_records():
+    assert list(merge_records(config, RECORDS)) == [
+        {
+            "id": 1,
+            "name": "Luke Skywalker",
+            "film": [
+                "https://swapi.dev/api/films/1/",
+                "https://swapi.dev/api/films/2/",
+            ],
+            "rank": "Commander",
+        },
+        {"id": 2, "name": "Leia Organa", "film": "https://swapi.dev/api/films/1/"},
+    ]
+
+
+def test_quadify_merged_removes_duplicate_facts():
+    quads = list(quadify_merged(config, RECORDS))
+    unmerged = [quad for record in RECORDS for quad in config.quadify(record)]
+    assert len(unmerged) == 8
+    assert len(quads) == 6
+    assert {quad.to_tuple() for quad in quads} == {quad.to_tuple() for quad in unmerged}
+
+
+def test_merge_window():
+    merged = list(merge_records(config, RECORDS, window=1))
+    assert [record["id"] for record in merged] == [1, 2, 1]
+    assert merged[2] == {
+        "id": 1,
+        "name": "Luke Skywalker",
+        "film": "https://swapi.dev/api/films/2/",
+        "rank": "Commander",
+    }
+
+
+def test_merge_sorted_input():
+    records = sorted(RECORDS, key=lambda record: record["id"])
+    merged = list(merge_records(config, records, sorted_input=True))
+    assert [record["id"] for record in merged] == [1, 2]
+
+
+def test_merge_keeps_distinct_types():
+    records = [{"id": 1, "rank": 1}, {"id": 1, "rank": True}, {"id": 1, "rank": 1}]
+    assert list(merge_records(config, records)) == [{"id": 1, "rank": [1, True]}]
+
+
+def test_merge_json_lists():
+    records = [{"id": 1, "rank": '["a"]'}, {"id": 1, "rank": '["a", "b"]'}]
+    assert list(merge_records(config, records)) == [{"id": 1, "rank": ["a", "b"]}]
+    quads = list(quadify_merged(config, records))
+    assert [quad.obj for quad in quads] == [Literal("a"), Literal("b")]
+
+
+@pytest.mark.parametrize("value", ['["[1, 2]"]', "[[1, 2]]", ['["[1, 2]", "a"]', "b"]])
+def test_merge_keeps_json_list_items(value):
+    records = [{"id": 1, "rank": value}, {"id": 1, "rank": value}]
+    unmerged = {quad.to_tuple() for quad in config.quadify(records[0])}
+    quads = list(quadify_merged(config, records))
+    assert len(quads) == len(unmerged)
+    assert {quad.to_tuple() for quad in quads} == unmerged
+
+
+@pytest.mark.parametrize(
+    "obj_datatype,values,expected",
+    [
+        (
+            "date",
+            ["2022-01-01", date(2022, 1, 1)],
+            Literal("2022-01-01", datatype=XSD.date),
+        ),
+        ("integer", ["1", 1], Literal(1, datatype=XSD.integer)),
+    ],
+)
+def test_merge_converted_values(obj_datatype, values, expected):
+    typed_config = GraphFormatConfig(
+        primary_key="id",
+        source_name="star wars",
+        predicate_mapping={
+            "value": {
+                "predicate_uri": "https://starwarsdb.org/value",
+                "obj_datatype": obj_datatype,
+            }
+        },
+    )
+    records = [{"id": 1, "value": value} for value in values]
+    assert list(merge_records(typed_config, records)) == [{"id": 1, "value": values[0]}]
+    quads = list(quadify_merged(typed_config, records))
+    assert [quad.obj for quad in quads] == [expected]
+
+
+def test_merge_by_named_graph():
+    dated_config = GraphFormatConfig(
+        date_field="updated_at", **config.dict(exclude_none=True)
+    )
+    records = [
+        {"id": 1, "name": "Luke", "updated_at": "2022-01-01"},
+        {"id": 1, "name": "Luke Skywalker", "updated_at": "2022-01-02"},
+        {"id": 1, "rank": "Commander", "updated_at": "2022-01-02"},
+    ]
+    merged = list(merge_records(dated_config, records))
+    assert merged == [
+        {"id": 1, "updated_at": "2022-01-01", "name": "Luke"},
+        {
+            "id": 1,
+            "updated_at": "2022-01-02",
+            "name": "Luke Skywalker",
+            "rank": "Commander",
+        },
+    ]
+
+
+def test_merge_nested_records():
+    nested_config = GraphFormatConfig(
+        primary_key="character.id",
+        source_name="star wars",
+        predicate_mapping={
+            "character.name": {"predicate_uri": "https://schema.org/name"}
+        },
+    )
+    records = [
+        {"character": {"id": 1, "name": "Luke"}},
+        {"character": {"id": 1, "name": "Luke Skywalker"}},
+    ]
+    quads = list(quadify_merged(nested_config, records))
+    assert [quad.obj for quad in quads] == [Literal("Luke"), Literal("Luke Skywalker")]
+    assert {quad.subject for quad in quads} == {URIRef("1")}
+
+
+def test_invalid_window():
+    with pytest.raises(ValueError):
+        list(merge_records(config, RECORDS, window=0))
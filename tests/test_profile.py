@@ -0,0 +1,65 @@
+import pytest
+from rdflib import URIRef
+
+from quadipy.profile import profile_config
+from quadipy.schemas.graph_format_config import GraphFormatConfig
+
+config = GraphFormatConfig(
+    primary_key="id",
+    source_name="star wars",
+    graph_namespace="graph://star-wars",
+    predicate_mapping={
+        "name": {"predicate_uri": "https://schema.org/name"},
+        "industry": {"predicate_uri": "https://schema.org/industry"},
+        "url": {"predicate_uri": "https://schema.org/url", "obj_datatype": "uri"},
+        "sameAs": {
+            "predicate_uri": "https://schema.org/url",
+            "obj_datatype": "uri",
+        },
+    },
+)
+RECORDS = [
+    {"id": 1, "name": "Rebel Alliance", "industry": '["Military", "Politics"]'},
+    {"id": 2, "name": "Galactic Empire", "url": "https://empire.gov"},
+    {"id": 2, "name": "Galactic Empire"},
+    {"id": 3, "industry": "Smuggling", "sameAs": "https://smugglers.org"},
+]
+NAME = URIRef("https://schema.org/name")
+INDUSTRY = URIRef("https://schema.org/industry")
+URL = URIRef("https://schema.org/url")
+
+
+def test_profile_config():
+    report = profile_config(config, RECORDS, total_records=400)
+    assert report.records == 4
+    assert report.quads == 8
+    assert report.quads_per_record == pytest.approx(2)
+    assert report.distinct_subjects == 3
+    assert report.distinct_graphs == 1
+    assert report.bytes == sum(
+        len(quad.to_nquad()) for record in RECORDS for quad in config.quadify(record)
+    )
+    assert list(report.predicates) == [NAME, INDUSTRY, URL]
+    assert report.predicates[NAME].quads == 3
+    assert report.predicates[INDUSTRY].quads == 3
+    assert report.predicates[INDUSTRY].records == 2
+    assert report.predicates[URL].columns == ["url", "sameAs"]
+    assert report.predicates[URL].quads == 2
+    assert report.predicates[URL].records == 2
+    assert report.seconds == report.read_seconds + report.quadify_seconds
+    assert report.estimated_quads == 800
+    assert report.estimated_bytes == report.bytes * 100
+    assert report.estimated_seconds == pytest.approx(report.seconds * 100)
+
+
+def test_profile_config_sample():
+    report = profile_config(config, iter(RECORDS), sample_size=2)
+    assert report.records == 2
+    assert report.total_records is None
+    assert report.estimated_quads is None
+
+
+def test_profile_config_whole_input_sampled():
+    report = profile_config(config, RECORDS, sample_size=10)
+    assert report.total_records == 4
+    assert report.estimated_quads == report.quads
@@ -0,0 +1,84 @@
+import gzip
+import os
+import random
+
+import pytest
+from rdflib import Literal, URIRef
+
+from quadipy.schemas.quad import Quad
+from quadipy.sort import sort_quads, write_sorted_nquads
+
+
+def make_quad(subject, predicate, obj, graph=None):
+    return Quad(
+        subject=URIRef(f"https://starwarsdb.org/{subject}"),
+        predicate=URIRef(f"https://schema.org/{predicate}"),
+        obj=Literal(obj),
+        graph=URIRef(f"graph://{graph}") if graph else None,
+    )
+
+
+QUADS = [
+    make_quad(subject, predicate, f"value {i % 7}", graph)
+    for i, (subject, predicate, graph) in enumerate(
+        (s, p, g)
+        for s in ("luke", "leia", "han", "hanSolo")
+        for p in ("name", "planet", "planetName")
+        for g in (None, "star-wars", "star-wars-extended")
+        for _ in range(3)
+    )
+]
+
+
+def expected_lines(quads):
+    unique = {(q.graph.n3() if q.graph else "", q.to_nquad()) for q in quads}
+    return [line for _, line in sorted(unique)]
+
+
+@pytest.mark.parametrize("memory_budget", [1, 2000, 1024 * 1024])
+def test_sort_quads(tmp_path, memory_budget):
+    quads = QUADS * 2
+    random.Random(42).shuffle(quads)
+    lines = list(sort_quads(quads, memory_budget=memory_budget, tmp_dir=str(tmp_path)))
+    assert lines == expected_lines(QUADS)
+    assert len(lines) == len(set(lines))
+    assert os.listdir(tmp_path) == []
+
+
+def test_sort_quads_multiple_merge_passes(tmp_path):
+    lines = list(
+        sort_quads(QUADS[::-1], memory_budget=1, tmp_dir=str(tmp_path), fan_in=3)
+    )
+    assert lines == expected_lines(QUADS)
+
+
+def test_sort_groups_graph_and_subject():
+    lines = list(sort_quads(QUADS))
+    keys = [
+        (line.rsplit(" ", 2)[-2] if "graph://" in line else "", line.split(" ")[0])
+        for line in lines
+    ]
+    groups = [key for i, key in enumerate(keys) if i == 0 or key != keys[i - 1]]
+    assert len(groups) == len(set(groups))
+
+
+def test_sort_literal_with_spaces_and_newlines():
+    quads = [
+        make_quad("luke", "name", "Luke\nSkywalker"),
+        make_quad("luke", "name", "Luke Skywalker"),
+        make_quad("luke", "name", "Luke\nSkywalker"),
+    ]
+    assert list(sort_quads(quads, memory_budget=1)) == expected_lines(quads)
+
+
+def test_invalid_fan_in():
+    with pytest.raises(ValueError):
+        list(sort_quads(QUADS, fan_in=1))
+
+
+def test_write_sorted_nquads(tmp_path):
+    path = tmp_path / "output.nq.gz"
+    count = write_sorted_nquads(QUADS, str(path), memory_budget=2000)
+    lines = gzip.decompress(path.read_bytes()).decode("utf-8").splitlines(keepends=True)
+    assert lines == expected_lines(QUADS)
+    assert count == len(lines)
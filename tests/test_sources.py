@@ -0,0 +1,50 @@
+import gzip
+import json
+
+import pytest
+
+from quadipy.sources import read_csv, read_jsonl, read_records
+
+RECORDS = [{"id": "1", "name": "Luke Skywalker"}, {"id": "2", "name": "Leia Organa"}]
+
+
+def test_read_jsonl(tmp_path):
+    path = tmp_path / "records.jsonl"
+    path.write_text("\n".join(json.dumps(record) for record in RECORDS) + "\n\n")
+    assert list(read_jsonl(str(path))) == RECORDS
+
+
+def test_read_compressed_jsonl(tmp_path):
+    path = tmp_path / "records.jsonl.gz"
+    lines = "".join(json.dumps(record) + "\n" for record in RECORDS)
+    path.write_bytes(gzip.compress(lines.encode("utf-8")))
+    assert list(read_jsonl(str(path))) == RECORDS
+
+
+def test_read_csv(tmp_path):
+    path = tmp_path / "records.csv"
+    path.write_text('id,name\n1,Luke Skywalker\n2,"Leia Organa"\n')
+    assert list(read_csv(str(path))) == RECORDS
+
+
+@pytest.mark.parametrize(
+    "name,content",
+    [
+        ("records.csv.gz", "id,name\n1,Luke Skywalker\n2,Leia Organa\n"),
+        ("records.tsv", "id\tname\n1\tLuke Skywalker\n2\tLeia Organa\n"),
+        (
+            "records.ndjson.gz",
+            "".join(json.dumps(record) + "\n" for record in RECORDS),
+        ),
+    ],
+)
+def test_read_records(tmp_path, name, content):
+    path = tmp_path / name
+    data = content.encode("utf-8")
+    path.write_bytes(gzip.compress(data) if name.endswith(".gz") else data)
+    assert list(read_records(str(path))) == RECORDS
+
+
+def test_read_records_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        read_records(str(tmp_path / "records.parquet"))
@@ -0,0 +1,133 @@
+import pytest
+from rdflib import Graph, Literal, URIRef
+
+from quadipy.schemas.graph_format_config import GraphFormatConfig
+from quadipy.store import QuadifyStore
+
+NAME = URIRef("https://schema.org/name")
+PLANET = URIRef("https://starwarsdb.org/planet")
+config = GraphFormatConfig(
+    primary_key="id",
+    source_name="star wars",
+    subject_namespace="https://starwarsdb.org/character",
+    predicate_mapping={
+        "name": {"predicate_uri": NAME},
+        "nickname": {"predicate_uri": NAME},
+        "planet": {
+            "predicate_uri": PLANET,
+            "obj_datatype": "uri",
+            "obj_namespace": "https://starwarsdb.org/planet",
+        },
+        "affiliation": {"predicate_uri": "https://starwarsdb.org/affiliation"},
+    },
+)
+RECORDS = [
+    {"id": 1, "name": "Luke Skywalker", "nickname": "Wormie", "planet": "tatooine"},
+    {"id": 2, "name": "Leia Organa", "planet": "alderaan"},
+    {"id": 3, "name": "Han Solo", "affiliation": '["Rebel Alliance", "Smugglers"]'},
+]
+LUKE = URIRef("https://starwarsdb.org/character/1")
+
+
+@pytest.fixture
+def graph():
+    return Graph(store=QuadifyStore(config, RECORDS))
+
+
+@pytest.fixture
+def quadified_columns(monkeypatch):
+    calls = []
+    quadify_column = GraphFormatConfig.quadify_column
+
+    def spy(self, record, col_name):
+        calls.append((record["id"], col_name))
+        return quadify_column(self, record, col_name)
+
+    monkeypatch.setattr(GraphFormatConfig, "quadify_column", spy)
+    return calls
+
+
+def test_matches_full_quadify(graph):
+    expected = {
+        quad.to_tuple()[:3] for record in RECORDS for quad in config.quadify(record)
+    }
+    assert set(graph) == expected
+    assert len(graph) == 8
+
+
+def test_known_subject_only_quadifies_its_record(graph, quadified_columns):
+    assert set(graph.objects(LUKE, NAME)) == {
+        Literal("Luke Skywalker"),
+        Literal("Wormie"),
+    }
+    assert quadified_columns == [(1, "name"), (1, "nickname")]
+
+
+def test_known_predicate_only_quadifies_its_columns(graph, quadified_columns):
+    planets = set(graph.subject_objects(PLANET))
+    assert planets == {
+        (LUKE, URIRef("https://starwarsdb.org/planet/tatooine")),
+        (
+            URIRef("https://starwarsdb.org/character/2"),
+            URIRef("https://starwarsdb.org/planet/alderaan"),
+        ),
+    }
+    assert {col_name for _, col_name in quadified_columns} == {"planet"}
+
+
+def test_object_pattern(graph):
+    assert list(graph.subjects(NAME, Literal("Leia Organa"))) == [
+        URIRef("https://starwarsdb.org/character/2")
+    ]
+
+
+def test_unknown_subject_or_predicate(graph):
+    assert not list(
+        graph.triples((URIRef("https://starwarsdb.org/character/4"), None, None))
+    )
+    assert not list(graph.triples((LUKE, URIRef("https://schema.org/unknown"), None)))
+
+
+def test_sparql(graph):
+    results = graph.query("""
+        SELECT ?affiliation WHERE {
+            ?character <https://schema.org/name> "Han Solo" ;
+                <https://starwarsdb.org/affiliation> ?affiliation .
+        }
+        """)
+    assert {row.affiliation for row in results} == {
+        Literal("Rebel Alliance"),
+        Literal("Smugglers"),
+    }
+
+
+def test_duplicate_records():
+    records = [{"id": 1, "name": "Luke Skywalker"}, {"id": 1, "name": "Luke Skywalker"}]
+    graph = Graph(store=QuadifyStore(config, records))
+    assert list(graph.triples((None, NAME, None))) == [
+        (LUKE, NAME, Literal("Luke Skywalker"))
+    ]
+    assert len(graph) == 1
+    results = graph.query("SELECT (COUNT(*) AS ?count) WHERE { ?s ?p ?o }")
+    assert [row["count"].toPython() for row in results] == [1]
+
+
+def test_read_only(graph):
+    with pytest.raises(TypeError):
+        graph.add((LUKE, NAME, Literal("Luke")))
+    with pytest.raises(TypeError):
+        graph.remove((LUKE, None, None))
+
+
+def test_records_indexed_once():
+    consumed = []
+
+    def records():
+        for record in RECORDS:
+            consumed.append(record["id"])
+            yield record
+
+    graph = Graph(store=QuadifyStore(config, records()))
+    assert len(list(graph.triples((LUKE, None, None)))) == 3
+    assert len(list(graph.triples((LUKE, None, None)))) == 3
+    assert consumed == [1, 2, 3]